@@ -1,6 +1,123 @@
 """Multiple testing correction procedures."""
 from typing import Hashable, Mapping
 
+import numpy as np
+import numpy.typing as npt
+
+
+def _get_array(p: Mapping[Hashable, float]) -> npt.NDArray[np.float64]:
+    """
+    Returns the p-values of a mapping as an array.
+
+    Args:
+        p: Keyed p-values.
+
+    Returns:
+        The p-values in the order of their keys.
+    """
+    return np.fromiter(p.values(), dtype=np.float64, count=len(p))
+
+
+def _get_harmonic_number(m: int) -> float:
+    """
+    Returns the harmonic number of a number of tests.
+
+    Args:
+        m: The number of tests.
+
+    Returns:
+        The sum of the reciprocals of 1 to m.
+    """
+    return float(np.reciprocal(np.arange(1, m + 1, dtype=np.float64)).sum())
+
+
+def _benjamini_hochberg(p: npt.NDArray[np.float64],
+                        dependent: bool = False) -> npt.NDArray[np.float64]:
+    """
+    Benjamini-Hochberg method for multiple testing correction of an array of
+    p-values.
+
+    Args:
+        p: The p-values.
+        dependent: Whether to rescale the p-values by the harmonic number of
+            their count according to Benjamini and Yekutieli.
+
+    Returns:
+        The Benjamini-Hochberg-adjusted p-values in the order of p. Undefined
+        p-values remain undefined and do not count towards the number of tests.
+    """
+    # Sort the p-values, excluding undefined ones.
+    m = p.shape[0] - int(np.count_nonzero(np.isnan(p)))
+    order = np.argsort(p, kind="stable")[:m]
+
+    # Rescale the p-values to adjust for multiple testing.
+    p_adjusted = p[order] * m / np.arange(1, m + 1)
+    if dependent:
+        p_adjusted *= _get_harmonic_number(m)
+
+    # Ensure the order of p-values is maintained by adjustment.
+    np.minimum.accumulate(p_adjusted[::-1], out=p_adjusted[::-1])
+    np.clip(p_adjusted, None, 1.0, out=p_adjusted)
+
+    # Restore the order of the p-values.
+    p_restored = np.full(p.shape[0], np.nan)
+    p_restored[order] = p_adjusted
+    return p_restored
+
+
+def _holm(p: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Holm method for multiple testing correction of an array of p-values.
+
+    Args:
+        p: The p-values.
+
+    Returns:
+        The Holm-adjusted p-values in the order of p. Undefined p-values remain
+        undefined and do not count towards the number of tests.
+    """
+    # Sort the p-values, excluding undefined ones.
+    m = p.shape[0] - int(np.count_nonzero(np.isnan(p)))
+    order = np.argsort(p, kind="stable")[:m]
+
+    # Rescale the p-values to adjust for multiple testing.
+    p_adjusted = p[order] * np.arange(m, 0, -1)
+
+    # Ensure the order of p-values is maintained by adjustment.
+    np.maximum.accumulate(p_adjusted, out=p_adjusted)
+    np.clip(p_adjusted, None, 1.0, out=p_adjusted)
+
+    # Restore the order of the p-values.
+    p_restored = np.full(p.shape[0], np.nan)
+    p_restored[order] = p_adjusted
+    return p_restored
+
+
+def _hommel(p: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Multiple testing correction of an array of p-values according to Hommel's
+    inequality.
+
+    Args:
+        p: The p-values.
+
+    Returns:
+        The Hommel-adjusted p-values in the order of p. Undefined p-values
+        remain undefined and do not count towards the number of tests.
+    """
+    # Sort the p-values, excluding undefined ones.
+    m = p.shape[0] - int(np.count_nonzero(np.isnan(p)))
+    order = np.argsort(p, kind="stable")[:m]
+
+    # Rescale the p-values to adjust for multiple testing.
+    p_adjusted = p[order] * m * _get_harmonic_number(m) / np.arange(1, m + 1)
+    np.clip(p_adjusted, None, 1.0, out=p_adjusted)
+
+    # Restore the order of the p-values.
+    p_restored = np.full(p.shape[0], np.nan)
+    p_restored[order] = p_adjusted
+    return p_restored
+
 
 def benjamini_hochberg(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
     """
@@ -13,25 +130,19 @@ def benjamini_hochberg(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
         p: Keyed p-values.
 
     Returns:
-        Keyed Benjamini-Hochberg-adjusted p-values.
+        Keyed Benjamini-Hochberg-adjusted p-values in the order of the keys of
+        p. Undefined p-values remain undefined and do not count towards the
+        number of tests.
     """
-    m = len(p)
-
-    # Sort the p-values.
-    p_sorted = dict(sorted(p.items(), key=lambda item: item[1], reverse=True))
+    # A single p-value requires no adjustment beyond its upper bound.
+    if len(p) < 2:
+        return {key: min(pi, 1.0) for key, pi in p.items()}
 
-    # Ensure the order of p-values is maintained by adjustment.
-    pj = 0.0
-    for i, (key, pi) in enumerate(p_sorted.items()):
-        if i and pi / (m - i) > pj / (m - i + 1):
-            p_sorted[key] = pj * (m - i) / (m - i + 1)
-        pj = p_sorted[key]
+    # Adjust the p-values.
+    p_adjusted = _benjamini_hochberg(_get_array(p))
 
-    # Rescale the p-values to adjust for multiple testing.
-    return {
-        key: min(m * pi / (m - i), 1.0)
-        for i, (key, pi) in enumerate(p_sorted.items())
-    }
+    # Return the adjusted p-values by their keys.
+    return dict(zip(p, p_adjusted.tolist()))
 
 
 def benjamini_yekutieli(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
@@ -45,26 +156,19 @@ def benjamini_yekutieli(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
         p: Keyed p-values.
 
     Returns:
-        Keyed Benjamini-Yekutieli-adjusted p-values.
+        Keyed Benjamini-Yekutieli-adjusted p-values in the order of the keys of
+        p. Undefined p-values remain undefined and do not count towards the
+        number of tests.
     """
-    m = len(p)
-    l = sum(1 / k for k in range(1, m + 1))
+    # A single p-value requires no adjustment beyond its upper bound.
+    if len(p) < 2:
+        return {key: min(pi, 1.0) for key, pi in p.items()}
 
-    # Sort the p-values.
-    p_sorted = dict(sorted(p.items(), key=lambda item: item[1], reverse=True))
+    # Adjust the p-values.
+    p_adjusted = _benjamini_hochberg(_get_array(p), dependent=True)
 
-    # Ensure the order of p-values is maintained by adjustment.
-    pj = 0.0
-    for i, (key, pi) in enumerate(p_sorted.items()):
-        if i and pi / (m - i) > pj / (m - i + 1):
-            p_sorted[key] = pj * (m - i) / (m - i + 1)
-        pj = p_sorted[key]
-
-    # Rescale the p-values to adjust for multiple testing.
-    return {
-        key: min(m * l * pi / (m - i), 1.0)
-        for i, (key, pi) in enumerate(p_sorted.items())
-    }
+    # Return the adjusted p-values by their keys.
+    return dict(zip(p, p_adjusted.tolist()))
 
 
 def holm(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
@@ -78,25 +182,18 @@ def holm(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
         p: Keyed p-values.
 
     Returns:
-        Keyed Holm-adjusted p-values.
+        Keyed Holm-adjusted p-values in the order of the keys of p. Undefined
+        p-values remain undefined and do not count towards the number of tests.
     """
-    m = len(p)
-
-    # Sort the p-values.
-    p_sorted = dict(sorted(p.items(), key=lambda item: item[1]))
+    # A single p-value requires no adjustment beyond its upper bound.
+    if len(p) < 2:
+        return {key: min(pi, 1.0) for key, pi in p.items()}
 
-    # Ensure the order of p-values is maintained by adjustment.
-    pj = 0.0
-    for i, (key, pi) in enumerate(p_sorted.items()):
-        if i and (m - i) * pi < (m - i - 1) * pj:
-            p_sorted[key] = (m - i - 1) * pj / (m - i)
-        pj = p_sorted[key]
+    # Adjust the p-values.
+    p_adjusted = _holm(_get_array(p))
 
-    # Rescale the p-values to adjust for multiple testing.
-    return {
-        key: min((m - i) * pi, 1.0)
-        for i, (key, pi) in enumerate(p_sorted.items())
-    }
+    # Return the adjusted p-values by their keys.
+    return dict(zip(p, p_adjusted.tolist()))
 
 
 def hommel(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
@@ -110,13 +207,15 @@ def hommel(p: Mapping[Hashable, float]) -> dict[Hashable, float]:
         p: Keyed p-values.
 
     Returns:
-        Keyed Hommel-adjusted p-values.
+        Keyed Hommel-adjusted p-values in the order of the keys of p. Undefined
+        p-values remain undefined and do not count towards the number of tests.
     """
-    m = len(p)
-    l = sum(1 / k for k in range(1, m + 1))
+    # A single p-value requires no adjustment beyond its upper bound.
+    if len(p) < 2:
+        return {key: min(pi, 1.0) for key, pi in p.items()}
 
-    # Rescale the p-values to adjust for multiple testing.
-    return {
-        key: min(m * l * pi / i, 1.0) for i, (key, pi) in enumerate(
-            sorted(p.items(), key=lambda item: item[1]), start=1)
-    }
+    # Adjust the p-values.
+    p_adjusted = _hommel(_get_array(p))
+
+    # Return the adjusted p-values by their keys.
+    return dict(zip(p, p_adjusted.tolist()))
@@ -10,6 +10,13 @@ from databases import uniprot
 
 ORGANISM: dict[str, dict[int, str]] = {"files": {9606: "human"}}
 
+NAMESPACE: dict[Literal["cellular_component", "molecular_function",
+                        "biological_process"], Literal["C", "F", "P"]] = {
+                            "cellular_component": "C",
+                            "molecular_function": "F",
+                            "biological_process": "P"
+                        }
+
 
 def get_ontology(
     namespaces: Container[Literal["cellular_component", "molecular_function",
@@ -143,14 +150,7 @@ def convert_namespaces(
         The corresponding identifiers used in annotation files.
     """
     # Convert Gene Ontology namespace identifiers.
-    conversion: dict[Literal["cellular_component", "molecular_function",
-                             "biological_process"], Literal["C", "F", "P"]] = {
-                                 "cellular_component": "C",
-                                 "molecular_function": "F",
-                                 "biological_process": "P"
-                             }
-
-    return tuple(conversion[ns] for ns in namespaces)
+    return tuple(NAMESPACE[ns] for ns in namespaces)
 
 
 def get_enrichment(
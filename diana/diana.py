@@ -5,12 +5,13 @@ based on mass spectrometry data
 import argparse
 import concurrent.futures
 import csv
+import functools
 import json
 import logging
 import os
 import re
 import sys
-from typing import Any, Mapping
+from typing import Any, Callable, Container, Iterable, Mapping, Sequence
 
 import networkx as nx
 
@@ -24,6 +25,187 @@ from networks import (gene_ontology_network, protein_interaction_network,
                       reactome_network)
 
 
+@functools.lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """
+    Compiles a regular expression once for all data sets sharing it.
+
+    Args:
+        pattern: The regular expression.
+
+    Returns:
+        The compiled regular expression.
+    """
+    return re.compile(pattern)
+
+
+def select_proteins(
+        network: nx.Graph, scopes: Iterable[nx.Graph],
+        get_measurements: Callable[..., tuple[float, ...]],
+        modifications: Mapping[int, Container[str]],
+        configuration: Mapping[str, Any]) -> dict[nx.Graph, frozenset[str]]:
+    """
+    Selects proteins of subnetworks of a protein-protein interaction network
+    exceeding specified ranges of measurements for different types of
+    post-translational modification at different times of measurement.
+
+    Args:
+        network: The protein-protein interaction network.
+        scopes: The subnetworks of the protein-protein interaction network to
+            select proteins from.
+        get_measurements: A function returning the measurement distribution of
+            the protein-protein interaction network for a particular type of
+            post-translational modification at a particular time of measurement.
+        modifications: The types of post-translational modification represented
+            in the protein-protein interaction network at each time of
+            measurement.
+        configuration: The specification of the selection.
+
+    Returns:
+        The proteins selected from each subnetwork.
+    """
+    # Initialize the selection of proteins from the protein-protein interaction
+    # network.
+    intersection = configuration.get("intersection", False)
+    if intersection:
+        selection = set(network.nodes())
+    else:
+        selection = set()
+
+    # Compile the types of post-translational modification at each time of
+    # measurement to select proteins by.
+    criteria = [
+        (time, m)
+        for time in modifications
+        for m in configuration.get("post-translational modifications", [])
+        if m in modifications[time]
+    ]
+
+    for time, m in criteria:
+        # Derive the measurement range from the measurement distribution of the
+        # protein-protein interaction network.
+        site_average = average.SITE_AVERAGE[configuration.get(
+            "site average", {}).get(m, "maximum absolute logarithm")]
+        replicate_average = average.REPLICATE_AVERAGE[configuration.get(
+            "replicate average", {}).get(m, "mean")]
+        measurement_distribution = get_measurements(time, m, site_average,
+                                                    replicate_average)
+        measurement_score_type = configuration.get("score", {}).get(m)
+        measurement_score = score.MEASUREMENT_SCORE[measurement_score_type]
+        measurement_bounds = configuration.get("measurement", {}).get(
+            m, default.MEASUREMENT_RANGE[measurement_score_type])
+        measurement_range = (
+            measurement_score(measurement_bounds[0], measurement_distribution),
+            measurement_score(measurement_bounds[1], measurement_distribution),
+        )
+
+        # Select proteins exceeding the measurement range in the protein-protein
+        # interaction network.
+        proteins = protein_interaction_network.get_proteins(
+            network, time, m, site_average, replicate_average,
+            measurement_range)
+
+        # Stop once further criteria can not change the selection.
+        if intersection:
+            selection.intersection_update(proteins)
+            if not selection:
+                break
+        else:
+            selection.update(proteins)
+            if len(selection) == network.number_of_nodes():
+                break
+
+    # Restrict the selection to each subnetwork once.
+    return {
+        scope: frozenset(selection.intersection(scope.nodes()))
+        for scope in scopes
+    }
+
+
+def select_local_proteins(
+    network: nx.Graph,
+    communities: Sequence[nx.Graph],
+    get_measurements: Callable[..., tuple[float, ...]],
+    modifications: Mapping[int, Container[str]],
+    configuration: Mapping[str, Any],
+) -> tuple[dict[nx.Graph, frozenset[str]], list[Iterable[str]]]:
+    """
+    Selects proteins of communities of a protein-protein interaction network
+    and the reference sets of proteins for a local enrichment analysis.
+
+    Args:
+        network: The protein-protein interaction network.
+        communities: The communities of the protein-protein interaction network.
+        get_measurements: A function returning the measurement distribution of
+            the protein-protein interaction network for a particular type of
+            post-translational modification at a particular time of measurement.
+        modifications: The types of post-translational modification represented
+            in the protein-protein interaction network at each time of
+            measurement.
+        configuration: The specification of the local enrichment analysis.
+
+    Returns:
+        The proteins selected from each community and the reference sets of
+        proteins with respect to which enrichment is computed.
+    """
+    # Select subsets of proteins from communities of the protein-protein
+    # interaction network derived from average measurements of the proteins for
+    # different types of post-translational modification at different times of
+    # measurement.
+    if "post-translational modifications" in configuration:
+        subsets = select_proteins(network, communities, get_measurements,
+                                  modifications, configuration)
+
+        if configuration.get("network", False):
+            return subsets, [network.nodes()]
+        elif configuration.get("annotation", False):
+            return subsets, [set()]
+        else:
+            return subsets, [community.nodes() for community in communities]
+
+    # Select the proteins from communities of the protein-protein interaction
+    # network.
+    subsets = {
+        community: frozenset(community.nodes()) for community in communities
+    }
+
+    if configuration.get("annotation", False):
+        return subsets, [set()]
+    else:
+        return subsets, [network.nodes()]
+
+
+def get_enrichment_rows(label: str, scope: nx.Graph,
+                        enrichment: Mapping[tuple[str, str],
+                                            tuple[float, frozenset[str]]],
+                        p: float) -> list[list[Any]]:
+    """
+    Compiles table rows of significant enrichment test results ordered by
+    identifier.
+
+    Args:
+        label: The label of the network tested for enrichment.
+        scope: The network tested for enrichment.
+        enrichment: Corrected p-values and associated proteins for the
+            enrichment of each term or pathway by the network.
+        p: The significance level.
+
+    Returns:
+        The rows of the enrichment table for the network.
+    """
+    # Discard insignificant results before ordering them by identifier.
+    significant = sorted(
+        ((key, result) for key, result in enrichment.items() if result[0] <= p),
+        key=lambda item: item[0][0])
+
+    # Return the rows of significant results.
+    return [[
+        label, identifier, name, p_value,
+        scope.number_of_nodes(),
+        len(prt), " ".join(sorted(prt))
+    ] for (identifier, name), (p_value, prt) in significant]
+
+
 def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
     """
     Executes a workflow with identifier specified in configuration.
@@ -41,26 +223,21 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
     # Incorporate protein for mass spectrometry data sets into the
     # protein-protein interaction network.
     for time in configuration.get("mass spectrometry", {}):
-        for modification in configuration["mass spectrometry"][time]:
-            if not (configuration["mass spectrometry"][time][modification].get(
-                    "file") and os.path.isfile(
-                        configuration["mass spectrometry"][time][modification]
-                        ["file"]) and configuration["mass spectrometry"][time]
-                    [modification].get("accession column")):
-                if not configuration["mass spectrometry"][time][
-                        modification].get("file"):
+        for modification, data_set in configuration["mass spectrometry"][
+                time].items():
+            if not (data_set.get("file") and os.path.isfile(data_set["file"])
+                    and data_set.get("accession column")):
+                if not data_set.get("file"):
                     logger.warning(
                         "File for modification %s at time %s is not specified.",
                         modification, time)
 
-                elif not os.path.isfile(configuration["mass spectrometry"][time]
-                                        [modification]["file"]):
+                elif not os.path.isfile(data_set["file"]):
                     logger.warning(
                         "File specified for modification %s at time %s does "
                         "not exist.", modification, time)
 
-                elif not configuration["mass spectrometry"][time][
-                        modification].get("accession column"):
+                elif not data_set.get("accession column"):
                     logger.warning(
                         "Accession column for modification %s at time %s is "
                         "not specified.", modification, time)
@@ -69,91 +246,59 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
 
             logger.info(
                 "Adding proteins for modification %s at time %s from %s.",
-                modification, time,
-                configuration["mass spectrometry"][time][modification]["file"])
+                modification, time, data_set["file"])
 
             # Incorporate proteins associated with site-specific measurements
             # into the protein-protein interaction network.
-            if configuration["mass spectrometry"][time][modification].get(
-                    "position column"):
+            if data_set.get("position column"):
                 protein_interaction_network.add_sites_from_table(
                     network,
-                    file=configuration["mass spectrometry"][time][modification]
-                    ["file"],
-                    protein_accession_column=configuration["mass spectrometry"]
-                    [time][modification]["accession column"],
-                    protein_accession_format=re.compile(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("accession format", "^(.+)$")),
-                    position_column=configuration["mass spectrometry"][time]
-                    [modification]["position column"],
-                    position_format=re.compile(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("position format", "^(.+)$")),
-                    replicate_columns=configuration["mass spectrometry"][time]
-                    [modification]["replicate columns"],
-                    replicate_format=re.compile(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("replicate format", "^(.+)$")),
-                    sheet_name=configuration["mass spectrometry"][time]
-                    [modification].get("sheet", 1) - 1 if isinstance(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("sheet", 1),
-                        int) else configuration["mass spectrometry"][time]
-                    [modification]["sheet"],
-                    header=configuration["mass spectrometry"][time]
-                    [modification].get("header", 1) - 1,
+                    file=data_set["file"],
+                    protein_accession_column=data_set["accession column"],
+                    protein_accession_format=compile_pattern(
+                        data_set.get("accession format", "^(.+)$")),
+                    position_column=data_set["position column"],
+                    position_format=compile_pattern(
+                        data_set.get("position format", "^(.+)$")),
+                    replicate_columns=data_set["replicate columns"],
+                    replicate_format=compile_pattern(
+                        data_set.get("replicate format", "^(.+)$")),
+                    sheet_name=data_set.get("sheet", 1) - 1 if isinstance(
+                        data_set.get("sheet", 1), int) else data_set["sheet"],
+                    header=data_set.get("header", 1) - 1,
                     time=int(time) if time.isnumeric() else 0,
                     modification=modification,
-                    number_sites=configuration["mass spectrometry"][time]
-                    [modification].get("sites", 5),
-                    number_replicates=configuration["mass spectrometry"][time]
-                    [modification].get("replicates", 1),
-                    replicate_average=average.REPLICATE_AVERAGE[
-                        configuration["mass spectrometry"][time]
-                        [modification].get("replicate average", "mean")],
-                    measurement_score=score.LOGARITHM[
-                        configuration["mass spectrometry"][time]
-                        [modification].get("logarithm")],
+                    number_sites=data_set.get("sites", 5),
+                    number_replicates=data_set.get("replicates", 1),
+                    replicate_average=average.REPLICATE_AVERAGE[data_set.get(
+                        "replicate average", "mean")],
+                    measurement_score=score.LOGARITHM[data_set.get(
+                        "logarithm")],
                     site_prioritization=prioritization.SITE_PRIORITIZATION[
-                        configuration["mass spectrometry"][time]
-                        [modification].get("site prioritization", "absolute")],
-                    site_order=order.SITE_ORDER[
-                        configuration["mass spectrometry"][time]
-                        [modification].get("site order", "measurement")])
+                        data_set.get("site prioritization", "absolute")],
+                    site_order=order.SITE_ORDER[data_set.get(
+                        "site order", "measurement")])
 
             # Incorporate proteins associated with protein-specific
             # measurements into the protein-protein interaction network.
             else:
                 protein_interaction_network.add_proteins_from_table(
                     network,
-                    file=configuration["mass spectrometry"][time][modification]
-                    ["file"],
-                    protein_accession_column=configuration["mass spectrometry"]
-                    [time][modification]["accession column"],
-                    protein_accession_format=re.compile(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("accession format", "^(.+)$")),
-                    replicate_columns=configuration["mass spectrometry"][time]
-                    [modification]["replicate columns"],
-                    replicate_format=re.compile(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("replicate format", "^(.+)$")),
-                    sheet_name=configuration["mass spectrometry"][time]
-                    [modification].get("sheet", 1) - 1 if isinstance(
-                        configuration["mass spectrometry"][time]
-                        [modification].get("sheet", 1),
-                        int) else configuration["mass spectrometry"][time]
-                    [modification]["sheet"],
-                    header=configuration["mass spectrometry"][time]
-                    [modification].get("header", 1) - 1,
+                    file=data_set["file"],
+                    protein_accession_column=data_set["accession column"],
+                    protein_accession_format=compile_pattern(
+                        data_set.get("accession format", "^(.+)$")),
+                    replicate_columns=data_set["replicate columns"],
+                    replicate_format=compile_pattern(
+                        data_set.get("replicate format", "^(.+)$")),
+                    sheet_name=data_set.get("sheet", 1) - 1 if isinstance(
+                        data_set.get("sheet", 1), int) else data_set["sheet"],
+                    header=data_set.get("header", 1) - 1,
                     time=int(time) if time.isnumeric() else 0,
                     modification=modification,
-                    number_replicates=configuration["mass spectrometry"][time]
-                    [modification].get("replicates", 1),
-                    measurement_score=score.LOGARITHM[
-                        configuration["mass spectrometry"][time]
-                        [modification].get("logarithm")])
+                    number_replicates=data_set.get("replicates", 1),
+                    measurement_score=score.LOGARITHM[data_set.get(
+                        "logarithm")])
 
     # Incorporate protein-protein interaction networks into the protein-protein
     # interaction network.
@@ -173,8 +318,7 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
 
         logger.info("Adding proteins from %s.", item["network"])
 
-        network = nx.compose(network,
-                             nx.readwrite.graphml.read_graphml(item["network"]))
+        network.update(nx.read_graphml(item["network"]))
 
     # Incorporate protein accessions into the protein-protein interaction
     # network.
@@ -192,10 +336,11 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                     protein_accession))
 
     # Assess availability of a local file for UniProt protein accessions.
-    if configuration.get("UniProt", {}).get("file"):
-        if os.path.isfile(configuration["UniProt"]["file"]):
+    file_uniprot = configuration.get("UniProt", {}).get("file")
+    if file_uniprot:
+        if os.path.isfile(file_uniprot):
             logger.info("Parsing UniProt protein accessions from %s.",
-                        configuration["UniProt"]["file"])
+                        file_uniprot)
         else:
             logger.warning(
                 "File specified for UniProt protein accessions does not exist.")
@@ -216,574 +361,271 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
         nodes_to_remove.intersection_update(
             protein_interaction_network.map_proteins(network,
                                                      organism,
-                                                     file=configuration.get(
-                                                         "UniProt",
-                                                         {}).get("file")))
+                                                     file=file_uniprot))
     network.remove_nodes_from(nodes_to_remove)
 
     # Add neighboring proteins to the protein-protein interaction network.
     if "protein-protein interactions" in configuration:
-        for neighbors in range(
-                max(configuration["protein-protein interactions"].get(
-                    database, {}).get("neighbors", 0) for database in
-                    configuration["protein-protein interactions"])):
-            interacting_proteins = set()
-
-            # Add neighboring proteins from BioGRID to the protein-protein
-            # interaction network.
-            if "BioGRID" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["BioGRID"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"]["BioGRID"].get(
-                        "file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["BioGRID"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from BioGRID from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["BioGRID"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "BioGRID"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from BioGRID does not exist.")
-
-                    logger.info("Adding neighbors of order %d from BioGRID.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_biogrid(
-                        network,
-                        interaction_throughput=configuration[
-                            "protein-protein interactions"]["BioGRID"].get(
-                                "interaction throughput", []),
-                        experimental_system=configuration[
-                            "protein-protein interactions"]["BioGRID"].get(
-                                "experimental system", []),
-                        experimental_system_type=configuration[
-                            "protein-protein interactions"]["BioGRID"].get(
-                                "experimental system type", []),
-                        multi_validated_physical=configuration[
-                            "protein-protein interactions"]["BioGRID"].get(
-                                "multi-validated physical", False),
-                        organism=configuration["protein-protein interactions"]
-                        ["BioGRID"].get("organism", 9606),
-                        version=configuration["protein-protein interactions"]
-                        ["BioGRID"].get("version"),
-                        file=configuration["protein-protein interactions"]
-                        ["BioGRID"].get("file"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Add neighboring proteins from CORUM to the protein-protein
-            # interaction network.
-            if "CORUM" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["CORUM"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"]["CORUM"].get(
-                        "file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["CORUM"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from CORUM from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["CORUM"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "CORUM"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from CORUM does not exist.")
-
-                    logger.info("Adding neighbors of order %d from CORUM.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_corum(
-                        network,
-                        purification_methods=configuration[
-                            "protein-protein interactions"]["CORUM"].get(
-                                "purification methods", []),
-                        file=configuration["protein-protein interactions"]
-                        ["CORUM"].get("file"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Add neighboring proteins from IntAct to the protein-protein
-            # interaction network.
-            if "IntAct" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["IntAct"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"]["IntAct"].get(
-                        "file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["IntAct"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from IntAct from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["IntAct"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "IntAct"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from IntAct does not exist.")
-
-                    logger.info("Adding neighbors of order %d from IntAct.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_intact(
-                        network,
-                        interaction_detection_methods=configuration[
-                            "protein-protein interactions"]["IntAct"].get(
-                                "interaction detection methods", []),
-                        interaction_types=configuration[
-                            "protein-protein interactions"]["IntAct"].get(
-                                "interaction types", []),
-                        psi_mi_score=configuration[
-                            "protein-protein interactions"]["IntAct"].get(
-                                "score", 0.0),
-                        organism=configuration["protein-protein interactions"]
-                        ["IntAct"].get("organism", 9606),
-                        file=configuration["protein-protein interactions"]
-                        ["IntAct"].get("file"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Add neighboring proteins from MINT to the protein-protein
-            # interaction network.
-            if "MINT" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["MINT"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"]["MINT"].get(
-                        "file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["MINT"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from MINT from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["MINT"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "MINT"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from MINT does not exist.")
-
-                    logger.info("Adding neighbors of order %d from MINT.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_mint(
-                        network,
-                        interaction_detection_methods=configuration[
-                            "protein-protein interactions"]["MINT"].get(
-                                "interaction detection methods", []),
-                        interaction_types=configuration[
-                            "protein-protein interactions"]["MINT"].get(
-                                "interaction types", []),
-                        psi_mi_score=configuration[
-                            "protein-protein interactions"]["MINT"].get(
-                                "score", 0.0),
-                        organism=configuration["protein-protein interactions"]
-                        ["MINT"].get("organism", 9606),
-                        file=configuration["protein-protein interactions"]
-                        ["MINT"].get("file"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Add neighboring proteins from Reactome to the protein-protein
-            # interaction network.
-            if "Reactome" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["Reactome"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"][
-                        "Reactome"].get("file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["Reactome"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from Reactome from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["Reactome"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "Reactome"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from Reactome does not exist.")
-
-                    logger.info("Adding neighbors of order %d from Reactome.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_reactome(
-                        network,
-                        interaction_context=configuration[
-                            "protein-protein interactions"]["Reactome"].get(
-                                "interaction context", []),
-                        interaction_type=configuration[
-                            "protein-protein interactions"]["Reactome"].get(
-                                "interaction type", []),
-                        organism=configuration["protein-protein interactions"]
-                        ["Reactome"].get("organism", 9606),
-                        file=configuration["protein-protein interactions"]
-                        ["Reactome"].get("file"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Add neighboring proteins from STRING to the protein-protein
-            # interaction network.
-            if "STRING" in configuration[
-                    "protein-protein interactions"] and configuration[
-                        "protein-protein interactions"]["STRING"].get(
-                            "neighbors", 0) > neighbors:
-                if configuration["protein-protein interactions"]["STRING"].get(
-                        "file") and os.path.isfile(
-                            configuration["protein-protein interactions"]
-                            ["STRING"]["file"]):
-                    logger.info(
-                        "Adding neighbors of order %d from STRING from %s.",
-                        neighbors, configuration["protein-protein interactions"]
-                        ["STRING"]["file"])
-                else:
-                    if configuration["protein-protein interactions"][
-                            "STRING"].get("file"):
-                        logger.warning(
-                            "File specified for protein-protein interactions "
-                            "from STRING does not exist.")
-
-                    logger.info("Adding neighbors of order %d from STRING.",
-                                neighbors)
-
-                interacting_proteins.update(
-                    protein_interaction_network.get_neighbors_from_string(
-                        network,
-                        neighborhood=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "neighborhood score", 0.0),
-                        neighborhood_transferred=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "neighborhood transferred score", 0.0),
-                        fusion=configuration["protein-protein interactions"]
-                        ["STRING"].get("fusion score", 0.0),
-                        cooccurence=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "cooccurence score", 0.0),
-                        homology=configuration["protein-protein interactions"]
-                        ["STRING"].get("homology score", 0.0),
-                        coexpression=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "coexpression score", 0.0),
-                        coexpression_transferred=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "coexpression transferred score", 0.0),
-                        experiments=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "experiments score", 0.0),
-                        experiments_transferred=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "experiments transferred score", 0.0),
-                        database=configuration["protein-protein interactions"]
-                        ["STRING"].get("database score", 0.0),
-                        database_transferred=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "database transferred score", 0.0),
-                        textmining=configuration["protein-protein interactions"]
-                        ["STRING"].get("textmining score", 0.0),
-                        textmining_transferred=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "textmining transferred score", 0.0),
-                        combined_score=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "combined score", 0.0),
-                        physical=configuration["protein-protein interactions"]
-                        ["STRING"].get("physical", False),
-                        organism=configuration["protein-protein interactions"]
-                        ["STRING"].get("organism", 9606),
-                        version=configuration["protein-protein interactions"]
-                        ["STRING"].get("version", 11.5),
-                        any_score=configuration["protein-protein interactions"]
-                        ["STRING"].get("any score", False),
-                        file=configuration["protein-protein interactions"]
-                        ["STRING"].get("file"),
-                        file_accession_map=configuration[
-                            "protein-protein interactions"]["STRING"].get(
-                                "file accession map"),
-                        file_uniprot=configuration.get("UniProt",
-                                                       {}).get("file")))
-
-            # Map protein accessions of neighboring proteins to primary UniProt
-            # accessions and remove neighboring proteins not found in Swiss-Prot
-            # from the protein-protein interaction network.
-            network.add_nodes_from(interacting_proteins)
-            nodes_to_remove = set(network.nodes())
-            for organism in set(configuration["protein-protein interactions"]
-                                [database].get("organism", 9606) for database in
-                                configuration["protein-protein interactions"]):
-                nodes_to_remove.intersection_update(
-                    protein_interaction_network.map_proteins(
-                        network, organism,
-                        configuration.get("UniProt", {}).get("file")))
-            network.remove_nodes_from(nodes_to_remove)
-
-        # Add protein-protein interactions from BioGRID to the protein-protein
-        # interaction network.
-        if "BioGRID" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["BioGRID"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]["BioGRID"]
-                        ["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from BioGRID from %s.",
-                    configuration["protein-protein interactions"]["BioGRID"]
-                    ["file"])
-            else:
-                if configuration["protein-protein interactions"]["BioGRID"].get(
-                        "file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "BioGRID does not exist.")
-
-                logger.info("Adding protein-protein interactions from BioGRID.")
-
-            protein_interaction_network.add_protein_interactions_from_biogrid(
-                network,
-                interaction_throughput=configuration[
-                    "protein-protein interactions"]["BioGRID"].get(
+        protein_interactions = configuration["protein-protein interactions"]
+
+        # Compile the parameters of queries to each database shared by the
+        # addition of neighbors and protein-protein interactions.
+        database_parameters: dict[str, dict[str, Any]] = {}
+        if "BioGRID" in protein_interactions:
+            database_parameters["BioGRID"] = {
+                "interaction_throughput":
+                    protein_interactions["BioGRID"].get(
                         "interaction throughput", []),
-                experimental_system=configuration[
-                    "protein-protein interactions"]["BioGRID"].get(
-                        "experimental system", []),
-                experimental_system_type=configuration[
-                    "protein-protein interactions"]["BioGRID"].get(
+                "experimental_system":
+                    protein_interactions["BioGRID"].get("experimental system",
+                                                        []),
+                "experimental_system_type":
+                    protein_interactions["BioGRID"].get(
                         "experimental system type", []),
-                multi_validated_physical=configuration[
-                    "protein-protein interactions"]["BioGRID"].get(
+                "multi_validated_physical":
+                    protein_interactions["BioGRID"].get(
                         "multi-validated physical", False),
-                organism=configuration["protein-protein interactions"]
-                ["BioGRID"].get("organism", 9606),
-                version=configuration["protein-protein interactions"]
-                ["BioGRID"].get("version"),
-                file=configuration["protein-protein interactions"]
-                ["BioGRID"].get("file"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Add protein-protein interactions from CORUM to the protein-protein
-        # interaction network.
-        if "CORUM" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["CORUM"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]["CORUM"]
-                        ["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from CORUM from %s.",
-                    configuration["protein-protein interactions"]["CORUM"]
-                    ["file"])
-            else:
-                if configuration["protein-protein interactions"]["CORUM"].get(
-                        "file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "CORUM does not exist.")
-
-                logger.info("Adding protein-protein interactions from CORUM.")
-
-            protein_interaction_network.add_protein_interactions_from_corum(
-                network,
-                purification_methods=configuration[
-                    "protein-protein interactions"]["CORUM"].get(
-                        "purification methods", []),
-                file=configuration["protein-protein interactions"]["CORUM"].get(
-                    "file"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Add protein-protein interactions from IntAct to the protein-protein
-        # interaction network.
-        if "IntAct" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["IntAct"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]["IntAct"]
-                        ["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from IntAct from %s.",
-                    configuration["protein-protein interactions"]["IntAct"]
-                    ["file"])
-            else:
-                if configuration["protein-protein interactions"]["IntAct"].get(
-                        "file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "IntAct does not exist.")
+                "organism":
+                    protein_interactions["BioGRID"].get("organism", 9606),
+                "version":
+                    protein_interactions["BioGRID"].get("version"),
+                "file":
+                    protein_interactions["BioGRID"].get("file"),
+                "file_uniprot":
+                    file_uniprot,
+            }
 
-                logger.info("Adding protein-protein interactions from IntAct.")
+        if "CORUM" in protein_interactions:
+            database_parameters["CORUM"] = {
+                "purification_methods":
+                    protein_interactions["CORUM"].get("purification methods",
+                                                      []),
+                "file":
+                    protein_interactions["CORUM"].get("file"),
+                "file_uniprot":
+                    file_uniprot,
+            }
 
-            protein_interaction_network.add_protein_interactions_from_intact(
-                network,
-                interaction_detection_methods=configuration[
-                    "protein-protein interactions"]["IntAct"].get(
+        if "IntAct" in protein_interactions:
+            database_parameters["IntAct"] = {
+                "interaction_detection_methods":
+                    protein_interactions["IntAct"].get(
                         "interaction detection methods", []),
-                interaction_types=configuration["protein-protein interactions"]
-                ["IntAct"].get("interaction types", []),
-                psi_mi_score=configuration["protein-protein interactions"]
-                ["IntAct"].get("score", 0.0),
-                organism=configuration["protein-protein interactions"]
-                ["IntAct"].get("organism", 9606),
-                file=configuration["protein-protein interactions"]
-                ["IntAct"].get("file"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Add protein-protein interactions from MINT to the protein-protein
-        # interaction network.
-        if "MINT" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["MINT"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]["MINT"]
-                        ["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from MINT from %s.",
-                    configuration["protein-protein interactions"]["MINT"]
-                    ["file"])
-            else:
-                if configuration["protein-protein interactions"]["MINT"].get(
-                        "file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "MINT does not exist.")
-
-                logger.info("Adding protein-protein interactions from MINT.")
+                "interaction_types":
+                    protein_interactions["IntAct"].get("interaction types", []),
+                "psi_mi_score":
+                    protein_interactions["IntAct"].get("score", 0.0),
+                "organism":
+                    protein_interactions["IntAct"].get("organism", 9606),
+                "file":
+                    protein_interactions["IntAct"].get("file"),
+                "file_uniprot":
+                    file_uniprot,
+            }
 
-            protein_interaction_network.add_protein_interactions_from_mint(
-                network,
-                interaction_detection_methods=configuration[
-                    "protein-protein interactions"]["MINT"].get(
+        if "MINT" in protein_interactions:
+            database_parameters["MINT"] = {
+                "interaction_detection_methods":
+                    protein_interactions["MINT"].get(
                         "interaction detection methods", []),
-                interaction_types=configuration["protein-protein interactions"]
-                ["MINT"].get("interaction types", []),
-                psi_mi_score=configuration["protein-protein interactions"]
-                ["MINT"].get("score", 0.0),
-                organism=configuration["protein-protein interactions"]
-                ["MINT"].get("organism", 9606),
-                file=configuration["protein-protein interactions"]["MINT"].get(
-                    "file"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Add protein-protein interactions from Reactome to the protein-protein
-        # interaction network.
-        if "Reactome" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["Reactome"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]
-                        ["Reactome"]["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from Reactome from "
-                    "%s.", configuration["protein-protein interactions"]
-                    ["Reactome"]["file"])
-            else:
-                if configuration["protein-protein interactions"][
-                        "Reactome"].get("file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "Reactome does not exist.")
-
-                logger.info(
-                    "Adding protein-protein interactions from Reactome.")
+                "interaction_types":
+                    protein_interactions["MINT"].get("interaction types", []),
+                "psi_mi_score":
+                    protein_interactions["MINT"].get("score", 0.0),
+                "organism":
+                    protein_interactions["MINT"].get("organism", 9606),
+                "file":
+                    protein_interactions["MINT"].get("file"),
+                "file_uniprot":
+                    file_uniprot,
+            }
 
-            protein_interaction_network.add_protein_interactions_from_reactome(
-                network,
-                interaction_context=configuration[
-                    "protein-protein interactions"]["Reactome"].get(
+        if "Reactome" in protein_interactions:
+            database_parameters["Reactome"] = {
+                "interaction_context":
+                    protein_interactions["Reactome"].get(
                         "interaction context", []),
-                interaction_type=configuration["protein-protein interactions"]
-                ["Reactome"].get("interaction type", []),
-                organism=configuration["protein-protein interactions"]
-                ["Reactome"].get("organism", 9606),
-                file=configuration["protein-protein interactions"]
-                ["Reactome"].get("file"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Add protein-protein interactions from STRING to the protein-protein
-        # interaction network.
-        if "STRING" in configuration["protein-protein interactions"]:
-            if configuration["protein-protein interactions"]["STRING"].get(
-                    "file") and os.path.isfile(
-                        configuration["protein-protein interactions"]["STRING"]
-                        ["file"]):
-                logger.info(
-                    "Adding protein-protein interactions from STRING from %s.",
-                    configuration["protein-protein interactions"]["STRING"]
-                    ["file"])
-            else:
-                if configuration["protein-protein interactions"]["STRING"].get(
-                        "file"):
-                    logger.warning(
-                        "File specified for protein-protein interactions from "
-                        "STRING does not exist.")
-
-                logger.info("Adding protein-protein interactions from STRING.")
+                "interaction_type":
+                    protein_interactions["Reactome"].get(
+                        "interaction type", []),
+                "organism":
+                    protein_interactions["Reactome"].get("organism", 9606),
+                "file":
+                    protein_interactions["Reactome"].get("file"),
+                "file_uniprot":
+                    file_uniprot,
+            }
 
-            protein_interaction_network.add_protein_interactions_from_string(
-                network,
-                neighborhood=configuration["protein-protein interactions"]
-                ["STRING"].get("neighborhood score", 0.0),
-                neighborhood_transferred=configuration[
-                    "protein-protein interactions"]["STRING"].get(
+        if "STRING" in protein_interactions:
+            database_parameters["STRING"] = {
+                "neighborhood":
+                    protein_interactions["STRING"].get("neighborhood score",
+                                                       0.0),
+                "neighborhood_transferred":
+                    protein_interactions["STRING"].get(
                         "neighborhood transferred score", 0.0),
-                fusion=configuration["protein-protein interactions"]
-                ["STRING"].get("fusion score", 0.0),
-                cooccurence=configuration["protein-protein interactions"]
-                ["STRING"].get("cooccurence score", 0.0),
-                homology=configuration["protein-protein interactions"]
-                ["STRING"].get("homology score", 0.0),
-                coexpression=configuration["protein-protein interactions"]
-                ["STRING"].get("coexpression score", 0.0),
-                coexpression_transferred=configuration[
-                    "protein-protein interactions"]["STRING"].get(
+                "fusion":
+                    protein_interactions["STRING"].get("fusion score", 0.0),
+                "cooccurence":
+                    protein_interactions["STRING"].get("cooccurence score",
+                                                       0.0),
+                "homology":
+                    protein_interactions["STRING"].get("homology score", 0.0),
+                "coexpression":
+                    protein_interactions["STRING"].get("coexpression score",
+                                                       0.0),
+                "coexpression_transferred":
+                    protein_interactions["STRING"].get(
                         "coexpression transferred score", 0.0),
-                experiments=configuration["protein-protein interactions"]
-                ["STRING"].get("experiments score", 0.0),
-                experiments_transferred=configuration[
-                    "protein-protein interactions"]["STRING"].get(
+                "experiments":
+                    protein_interactions["STRING"].get("experiments score",
+                                                       0.0),
+                "experiments_transferred":
+                    protein_interactions["STRING"].get(
                         "experiments transferred score", 0.0),
-                database=configuration["protein-protein interactions"]
-                ["STRING"].get("database score", 0.0),
-                database_transferred=configuration[
-                    "protein-protein interactions"]["STRING"].get(
+                "database":
+                    protein_interactions["STRING"].get("database score", 0.0),
+                "database_transferred":
+                    protein_interactions["STRING"].get(
                         "database transferred score", 0.0),
-                textmining=configuration["protein-protein interactions"]
-                ["STRING"].get("textmining score", 0.0),
-                textmining_transferred=configuration[
-                    "protein-protein interactions"]["STRING"].get(
+                "textmining":
+                    protein_interactions["STRING"].get("textmining score", 0.0),
+                "textmining_transferred":
+                    protein_interactions["STRING"].get(
                         "textmining transferred score", 0.0),
-                combined_score=configuration["protein-protein interactions"]
-                ["STRING"].get("combined score", 0.0),
-                physical=configuration["protein-protein interactions"]
-                ["STRING"].get("physical", False),
-                organism=configuration["protein-protein interactions"]
-                ["STRING"].get("organism", 9606),
-                version=configuration["protein-protein interactions"]
-                ["STRING"].get("version", 11.5),
-                any_score=configuration["protein-protein interactions"]
-                ["STRING"].get("any score", False),
-                file=configuration["protein-protein interactions"]
-                ["STRING"].get("file"),
-                file_accession_map=configuration["protein-protein interactions"]
-                ["STRING"].get("file accession map"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
+                "combined_score":
+                    protein_interactions["STRING"].get("combined score", 0.0),
+                "physical":
+                    protein_interactions["STRING"].get("physical", False),
+                "organism":
+                    protein_interactions["STRING"].get("organism", 9606),
+                "version":
+                    protein_interactions["STRING"].get("version", 11.5),
+                "any_score":
+                    protein_interactions["STRING"].get("any score", False),
+                "file":
+                    protein_interactions["STRING"].get("file"),
+                "file_accession_map":
+                    protein_interactions["STRING"].get("file accession map"),
+                "file_uniprot":
+                    file_uniprot,
+            }
+
+        # Determine the functions querying each database for neighbors and
+        # protein-protein interactions.
+        database_queries: dict[str, tuple[Callable[..., set[str]], Callable[
+            ..., None]]] = {
+                "BioGRID":
+                    (protein_interaction_network.get_neighbors_from_biogrid,
+                     protein_interaction_network.
+                     add_protein_interactions_from_biogrid),
+                "CORUM": (protein_interaction_network.get_neighbors_from_corum,
+                          protein_interaction_network.
+                          add_protein_interactions_from_corum),
+                "IntAct":
+                    (protein_interaction_network.get_neighbors_from_intact,
+                     protein_interaction_network.
+                     add_protein_interactions_from_intact),
+                "MINT": (protein_interaction_network.get_neighbors_from_mint,
+                         protein_interaction_network.
+                         add_protein_interactions_from_mint),
+                "Reactome":
+                    (protein_interaction_network.get_neighbors_from_reactome,
+                     protein_interaction_network.
+                     add_protein_interactions_from_reactome),
+                "STRING":
+                    (protein_interaction_network.get_neighbors_from_string,
+                     protein_interaction_network.
+                     add_protein_interactions_from_string),
+            }
+
+        # Determine the maximum order of neighbors to add from each database.
+        neighbor_orders = {
+            database: protein_interactions[database].get("neighbors", 0)
+            for database in protein_interactions
+        }
+
+        for neighbors in range(max(neighbor_orders.values(), default=0)):
+            interacting_proteins: list[set[str]] = []
+
+            # Add neighboring proteins from each database to the
+            # protein-protein interaction network.
+            for database, (get_neighbors, _) in database_queries.items():
+                if neighbor_orders.get(database, 0) > neighbors:
+                    if protein_interactions[database].get(
+                            "file") and os.path.isfile(
+                                protein_interactions[database]["file"]):
+                        logger.info(
+                            "Adding neighbors of order %d from %s from %s.",
+                            neighbors, database,
+                            protein_interactions[database]["file"])
+                    else:
+                        if protein_interactions[database].get("file"):
+                            logger.warning(
+                                "File specified for protein-protein "
+                                "interactions from %s does not exist.",
+                                database)
+
+                        logger.info("Adding neighbors of order %d from %s.",
+                                    neighbors, database)
+
+                    interacting_proteins.append(
+                        get_neighbors(network, **database_parameters[database]))
+
+            # Map protein accessions of neighboring proteins to primary UniProt
+            # accessions and remove neighboring proteins not found in Swiss-Prot
+            # before adding them to the protein-protein interaction network.
+            neighbor_network = nx.Graph()
+            neighbor_network.add_nodes_from(set().union(*interacting_proteins))
+            nodes_to_remove = set(neighbor_network.nodes())
+            for organism in set(
+                    protein_interactions[database].get("organism", 9606)
+                    for database in protein_interactions):
+                nodes_to_remove.intersection_update(
+                    protein_interaction_network.map_proteins(
+                        neighbor_network, organism, file_uniprot))
+            neighbor_network.remove_nodes_from(nodes_to_remove)
+            network.update(neighbor_network)
+
+    # Determine the types of post-translational modification represented in the
+    # protein-protein interaction network at any time of measurement.
+    modifications = {
+        time: protein_interaction_network.get_modifications(network, time)
+        for time in protein_interaction_network.get_times(network)
+    }
+
+    # Add protein-protein interactions to the protein-protein interaction
+    # network.
+    if "protein-protein interactions" in configuration:
+        # Add protein-protein interactions from each database to the
+        # protein-protein interaction network.
+        for database, (_, add_protein_interactions) in database_queries.items():
+            if database in protein_interactions:
+                if protein_interactions[database].get(
+                        "file") and os.path.isfile(
+                            protein_interactions[database]["file"]):
+                    logger.info(
+                        "Adding protein-protein interactions from %s from %s.",
+                        database, protein_interactions[database]["file"])
+                else:
+                    if protein_interactions[database].get("file"):
+                        logger.warning(
+                            "File specified for protein-protein interactions "
+                            "from %s does not exist.", database)
+
+                    logger.info("Adding protein-protein interactions from %s.",
+                                database)
+
+                add_protein_interactions(network,
+                                         **database_parameters[database])
 
         # Compile Cytoscape styles for the protein-protein interaction network
         # and annotate the protein-protein interaction network.
-        if any(
-                protein_interaction_network.get_modifications(network, time)
-                for time in protein_interaction_network.get_times(network)):
+        if any(modifications.values()):
 
             if "Cytoscape" in configuration:
+                cytoscape = configuration["Cytoscape"]
+
                 # Annotate nodes of the protein-protein interaction network with
                 # a categorization of average measurements for different types
                 # of post-translational modification at different times of
@@ -791,88 +633,74 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 measurements = {
                     modification: default.MEASUREMENT_RANGE.get(
                         score, default.MEASUREMENT_RANGE[None])
-                    for modification, score in configuration["Cytoscape"].get(
+                    for modification, score in cytoscape.get(
                         "node color", {}).get("score", {}).items()
                 }
 
-                for modification, measurement_range in configuration[
-                        "Cytoscape"].get("node color",
-                                         {}).get("measurement", {}).items():
+                for modification, measurement_range in cytoscape.get(
+                        "node color", {}).get("measurement", {}).items():
                     measurements[modification] = measurement_range
 
+                # Compile the functions to average and score measurements for
+                # different types of post-translational modification.
+                site_average = {
+                    modification: average.SITE_AVERAGE.get(
+                        site_average,
+                        average.SITE_AVERAGE["maximum absolute logarithm"])
+                    for modification, site_average in cytoscape.get(
+                        "site average", {}).items()
+                }
+
+                replicate_average = {
+                    modification: average.REPLICATE_AVERAGE.get(
+                        replicate_average, average.REPLICATE_AVERAGE["mean"])
+                    for modification, replicate_average in cytoscape.get(
+                        "replicate average", {}).items()
+                }
+
+                measurement_score = {
+                    modification:
+                    score.MEASUREMENT_SCORE.get(measurement_score,
+                                                score.MEASUREMENT_SCORE[None])
+                    for modification, measurement_score in cytoscape.get(
+                        "score", {}).items()
+                }
+
                 protein_interaction_network.set_measurements(
                     network,
-                    site_average={
-                        modification: average.SITE_AVERAGE.get(
-                            site_average,
-                            average.SITE_AVERAGE["maximum absolute logarithm"])
-                        for modification,
-                        site_average in configuration["Cytoscape"].get(
-                            "site average", {}).items()
-                    },
-                    replicate_average={
-                        modification: average.REPLICATE_AVERAGE.get(
-                            replicate_average,
-                            average.REPLICATE_AVERAGE["mean"]) for modification,
-                        replicate_average in configuration["Cytoscape"].get(
-                            "replicate average", {}).items()
-                    },
+                    site_average=site_average,
+                    replicate_average=replicate_average,
                     measurements=measurements,
-                    measurement_score={
-                        modification: score.MEASUREMENT_SCORE.get(
-                            measurement_score, score.MEASUREMENT_SCORE[None])
-                        for modification, measurement_score in
-                        configuration["Cytoscape"].get("score", {})
-                    })
+                    measurement_score=measurement_score)
 
                 # Annotate edges of the protein-protein interaction network with
                 # average protein-protein interaction confidence score reflected
                 # as edge transparency in Cytoscape.
                 protein_interaction_network.set_edge_weights(
                     network,
-                    weight=average.CONFIDENCE_SCORE_AVERAGE[
-                        configuration["Cytoscape"].get("edge transparency")],
+                    weight=average.CONFIDENCE_SCORE_AVERAGE[cytoscape.get(
+                        "edge transparency")],
                     attribute="score")
 
                 # Compile Cytoscape styles for the protein-protein interaction
                 # network.
                 styles = protein_interaction_network_style.get_styles(
                     network,
-                    node_shape_modifications=configuration["Cytoscape"].get(
+                    node_shape_modifications=cytoscape.get(
                         "node shape",
                         {}).get("post-translational modifications", []),
-                    node_color_modifications=configuration["Cytoscape"].get(
+                    node_color_modifications=cytoscape.get(
                         "node color",
                         {}).get("post-translational modifications", []),
-                    node_size_modification=configuration["Cytoscape"].get(
-                        "node size", {}).get("post-translational modification",
-                                             None),
-                    bar_chart_modifications=configuration["Cytoscape"].get(
-                        "bar chart", {}).get("post-translational modifications",
-                                             []),
-                    measurement_score={
-                        modification: score.MEASUREMENT_SCORE.get(
-                            measurement_score, score.MEASUREMENT_SCORE[None])
-                        for modification, measurement_score in
-                        configuration["Cytoscape"].get("score", {})
-                    },
-                    site_average={
-                        modification: average.SITE_AVERAGE.get(
-                            site_average,
-                            average.SITE_AVERAGE["maximum absolute logarithm"])
-                        for modification,
-                        site_average in configuration["Cytoscape"].get(
-                            "site average", {}).items()
-                    },
-                    replicate_average={
-                        modification: average.REPLICATE_AVERAGE.get(
-                            replicate_average,
-                            average.REPLICATE_AVERAGE["mean"]) for modification,
-                        replicate_average in configuration["Cytoscape"].get(
-                            "replicate average", {}).items()
-                    },
+                    node_size_modification=cytoscape.get("node size", {}).get(
+                        "post-translational modification", None),
+                    bar_chart_modifications=cytoscape.get("bar chart", {}).get(
+                        "post-translational modifications", []),
+                    measurement_score=measurement_score,
+                    site_average=site_average,
+                    replicate_average=replicate_average,
                     confidence_score_average=average.CONFIDENCE_SCORE_AVERAGE[
-                        configuration["Cytoscape"].get("edge transparency")])
+                        cytoscape.get("edge transparency")])
 
                 # Export the Cytoscape styles.
                 file = protein_interaction_network_style.export(
@@ -964,156 +792,56 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 "File specified associations of Reactome pathways and UniProt "
                 "protein accessions does not exist.")
 
+    # Memoize measurement distributions of the protein-protein interaction
+    # network shared by the selection of proteins for subsequent analyses.
+    get_measurements = functools.lru_cache(maxsize=None)(functools.partial(
+        protein_interaction_network.get_measurements, network))
+
     # Export a Gene Ontology network.
     if "Gene Ontology network" in configuration:
+        ontology_configuration = configuration["Gene Ontology network"]
+
         logger.info("Compiling the Gene Ontology network.")
 
-        # Compile a Gene Ontology network from subsets of proteins represented
-        # in the protein-protein interaction network determined from measurement
-        # averages.
-        if "post-translational modifications" in configuration[
-                "Gene Ontology network"]:
-            if configuration["Gene Ontology network"].get(
-                    "intersection", False):
-                proteins = set(network.nodes())
-            else:
-                proteins = set()
-
-            for time in protein_interaction_network.get_times(network):
-                for m in configuration["Gene Ontology network"].get(
-                        "post-translational modifications", []):
-                    if m in protein_interaction_network.get_modifications(
-                            network, time):
-                        measurement_range = (
-                            score.MEASUREMENT_SCORE[
-                                configuration["Gene Ontology network"].get(
-                                    "score", {}).get(m)]
-                            (configuration["Gene Ontology network"].
-                             get("measurement", {}).get(
-                                 m, default.MEASUREMENT_RANGE[
-                                     configuration["Gene Ontology network"].get(
-                                         "score", {}).get(m)])[0],
-                             protein_interaction_network.get_measurements(
-                                 network, time, m, average.SITE_AVERAGE[
-                                     configuration["Gene Ontology network"].get(
-                                         "site average",
-                                         {}).get(m,
-                                                 "maximum absolute logarithm")],
-                                 average.REPLICATE_AVERAGE[
-                                     configuration["Gene Ontology network"].get(
-                                         "replicate average",
-                                         {}).get(m, "mean")])),
-                            score.MEASUREMENT_SCORE[
-                                configuration["Gene Ontology network"].get(
-                                    "score", {}).get(m)]
-                            (configuration["Gene Ontology network"].get(
-                                "measurement", {}).get(
-                                    m, default.MEASUREMENT_RANGE[configuration[
-                                        "Gene Ontology network"].get(
-                                            "score", {}).get(m)])[1],
-                             protein_interaction_network.get_measurements(
-                                 network, time, m, average.SITE_AVERAGE[
-                                     configuration["Gene Ontology network"].get(
-                                         "site average",
-                                         {}).get(m,
-                                                 "maximum absolute logarithm")],
-                                 average.REPLICATE_AVERAGE[
-                                     configuration["Gene Ontology network"].get(
-                                         "replicate average",
-                                         {}).get(m, "mean")])))
-
-                        if configuration["Gene Ontology network"].get(
-                                "intersection", False):
-                            proteins.intersection_update(
-                                protein_interaction_network.get_proteins(
-                                    network, time, m,
-                                    average.SITE_AVERAGE[configuration[
-                                        "Gene Ontology network"].get(
-                                            "site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                    average.REPLICATE_AVERAGE[configuration[
-                                        "Gene Ontology network"].get(
-                                            "replicate average",
-                                            {}).get(m, "mean")],
-                                    measurement_range))
-
-                        else:
-                            proteins.update(
-                                protein_interaction_network.get_proteins(
-                                    network, time, m,
-                                    average.SITE_AVERAGE[configuration[
-                                        "Gene Ontology network"].get(
-                                            "site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                    average.REPLICATE_AVERAGE[configuration[
-                                        "Gene Ontology network"].get(
-                                            "replicate average",
-                                            {}).get(m, "mean")],
-                                    measurement_range))
-
-            ontology_network = gene_ontology_network.get_network(
-                proteins,
-                reference=network.nodes()
-                if not configuration["Gene Ontology network"].get(
-                    "annotation", False) else None,
-                namespaces=[
-                    namespace.replace(" ", "_")
-                    for namespace in configuration["Gene Ontology network"].get(
-                        "namespaces", [])
-                ],
-                enrichment_test=test.ENRICHMENT_TEST[(
-                    configuration["Gene Ontology network"].get(
-                        "test", "hypergeometric"),
-                    configuration["Gene Ontology network"].get(
-                        "increase", True))],
-                multiple_testing_correction=correction.CORRECTION[
-                    configuration["Gene Ontology network"].get(
-                        "correction", "Benjamini-Yekutieli")],
-                organism=configuration["Gene Ontology network"].get(
-                    "organism", 9606),
-                file_ontology=configuration.get("Gene Ontology",
-                                                {}).get("file",
-                                                        {}).get("ontology"),
-                file_annotation=configuration.get("Gene Ontology",
-                                                  {}).get("file",
-                                                          {}).get("annotation"),
-                file_annotation_isoform=configuration.get(
-                    "Gene Ontology", {}).get("file",
-                                             {}).get("annotation isoform"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Compile a Gene Ontology network from proteins represented in the
-        # protein-protein interaction network.
+        # Select subsets of proteins represented in the protein-protein
+        # interaction network determined from measurement averages.
+        if "post-translational modifications" in ontology_configuration:
+            proteins = select_proteins(network, [network], get_measurements,
+                                       modifications,
+                                       ontology_configuration)[network]
+            reference = network.nodes() if not ontology_configuration.get(
+                "annotation", False) else None
+
+        # Select proteins represented in the protein-protein interaction
+        # network.
         else:
-            ontology_network = gene_ontology_network.get_network(
-                network.nodes(),
-                namespaces=[
-                    namespace.replace(" ", "_")
-                    for namespace in configuration["Gene Ontology network"].get(
-                        "namespaces", [])
-                ],
-                enrichment_test=test.ENRICHMENT_TEST[(
-                    configuration["Gene Ontology network"].get(
-                        "test", "hypergeometric"),
-                    configuration["Gene Ontology network"].get(
-                        "increase", True))],
-                multiple_testing_correction=correction.CORRECTION[
-                    configuration["Gene Ontology network"].get(
-                        "correction", "Benjamini-Yekutieli")],
-                organism=configuration["Gene Ontology network"].get(
-                    "organism", 9606),
-                file_ontology=configuration.get("Gene Ontology",
-                                                {}).get("file",
-                                                        {}).get("ontology"),
-                file_annotation=configuration.get("Gene Ontology",
-                                                  {}).get("file",
-                                                          {}).get("annotation"),
-                file_annotation_isoform=configuration.get(
-                    "Gene Ontology", {}).get("file",
-                                             {}).get("annotation isoform"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
+            proteins = frozenset(network.nodes())
+            reference = None
+
+        # Compile a Gene Ontology network from the selected proteins.
+        ontology_network = gene_ontology_network.get_network(
+            proteins,
+            reference=reference,
+            namespaces=[
+                namespace.replace(" ", "_")
+                for namespace in ontology_configuration.get("namespaces", [])
+            ],
+            enrichment_test=test.ENRICHMENT_TEST[(ontology_configuration.get(
+                "test",
+                "hypergeometric"), ontology_configuration.get("increase",
+                                                              True))],
+            multiple_testing_correction=correction.CORRECTION[
+                ontology_configuration.get("correction",
+                                           "Benjamini-Yekutieli")],
+            organism=ontology_configuration.get("organism", 9606),
+            file_ontology=configuration.get("Gene Ontology",
+                                            {}).get("file", {}).get("ontology"),
+            file_annotation=configuration.get("Gene Ontology",
+                                              {}).get("file",
+                                                      {}).get("annotation"),
+            file_annotation_isoform=configuration.get("Gene Ontology", {}).get(
+                "file", {}).get("annotation isoform"),
+            file_uniprot=file_uniprot)
 
         # Export the Gene Ontology network.
         file = gene_ontology_network.export(ontology_network,
@@ -1144,135 +872,43 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
 
     # Export a Reactome network.
     if "Reactome network" in configuration:
+        pathway_configuration = configuration["Reactome network"]
+
         logger.info("Compiling the Reactome network.")
 
-        # Compile a Reactome network from subsets of proteins represented in the
-        # protein-protein interaction network determined from measurement
-        # averages.
-        if "post-translational modifications" in configuration[
-                "Reactome network"]:
-            if configuration["Reactome network"].get("intersection", False):
-                proteins = set(network.nodes())
-            else:
-                proteins = set()
-
-            for time in protein_interaction_network.get_times(network):
-                for m in configuration["Reactome network"].get(
-                        "post-translational modifications", []):
-                    if m in protein_interaction_network.get_modifications(
-                            network, time):
-                        measurement_range = (
-                            score.MEASUREMENT_SCORE[
-                                configuration["Reactome network"].get(
-                                    "score", {}).get(m)]
-                            (configuration["Reactome network"].get(
-                                "measurement", {}).get(
-                                    m, default.MEASUREMENT_RANGE[
-                                        configuration["Reactome network"].get(
-                                            "score", {}).get(m)])[0],
-                             protein_interaction_network.get_measurements(
-                                 network, time, m, average.SITE_AVERAGE[
-                                     configuration["Reactome network"].get(
-                                         "site average",
-                                         {}).get(m,
-                                                 "maximum absolute logarithm")],
-                                 average.REPLICATE_AVERAGE[
-                                     configuration["Reactome network"].get(
-                                         "replicate average",
-                                         {}).get(m, "mean")])),
-                            score.MEASUREMENT_SCORE[
-                                configuration["Reactome network"].get(
-                                    "score", {}).get(m)]
-                            (configuration["Reactome network"].get(
-                                "measurement", {}).get(
-                                    m, default.MEASUREMENT_RANGE[
-                                        configuration["Reactome network"].get(
-                                            "score", {}).get(m)])[1],
-                             protein_interaction_network.get_measurements(
-                                 network, time, m, average.SITE_AVERAGE[
-                                     configuration["Reactome network"].get(
-                                         "site average",
-                                         {}).get(m,
-                                                 "maximum absolute logarithm")],
-                                 average.REPLICATE_AVERAGE[
-                                     configuration["Reactome network"].get(
-                                         "replicate average",
-                                         {}).get(m, "mean")])))
-
-                        if configuration["Reactome network"].get(
-                                "intersection", False):
-                            proteins.intersection_update(
-                                protein_interaction_network.get_proteins(
-                                    network, time, m, average.SITE_AVERAGE[
-                                        configuration["Reactome network"].get(
-                                            "site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                    average.REPLICATE_AVERAGE[
-                                        configuration["Reactome network"].get(
-                                            "replicate average",
-                                            {}).get(m, "mean")],
-                                    measurement_range))
-
-                        else:
-                            proteins.update(
-                                protein_interaction_network.get_proteins(
-                                    network, time, m, average.SITE_AVERAGE[
-                                        configuration["Reactome network"].get(
-                                            "site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                    average.REPLICATE_AVERAGE[
-                                        configuration["Reactome network"].get(
-                                            "replicate average",
-                                            {}).get(m, "mean")],
-                                    measurement_range))
-
-            pathway_network = reactome_network.get_network(
-                proteins,
-                reference=network.nodes() if
-                not configuration["Reactome network"].get("annotation", False)
-                else None,
-                enrichment_test=test.ENRICHMENT_TEST[(
-                    configuration["Reactome network"].get(
-                        "test", "hypergeometric"),
-                    configuration["Reactome network"].get("increase", True))],
-                multiple_testing_correction=correction.CORRECTION[
-                    configuration["Reactome network"].get(
-                        "correction", "Benjamini-Yekutieli")],
-                organism=configuration["Reactome network"].get(
-                    "organism", 9606),
-                file_pathways=configuration.get("Reactome",
-                                                {}).get("file",
-                                                        {}).get("pathways"),
-                file_pathways_relation=configuration.get("Reactome", {}).get(
-                    "file", {}).get("pathways relation"),
-                file_accession_map=configuration.get("Reactome", {}).get(
-                    "file", {}).get("accession map"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-        # Compile a Reactome network from proteins represented in the
-        # protein-protein interaction network.
+        # Select subsets of proteins represented in the protein-protein
+        # interaction network determined from measurement averages.
+        if "post-translational modifications" in pathway_configuration:
+            proteins = select_proteins(network, [network], get_measurements,
+                                       modifications,
+                                       pathway_configuration)[network]
+            reference = network.nodes() if not pathway_configuration.get(
+                "annotation", False) else None
+
+        # Select proteins represented in the protein-protein interaction
+        # network.
         else:
-            pathway_network = reactome_network.get_network(
-                network.nodes(),
-                enrichment_test=test.ENRICHMENT_TEST[(
-                    configuration["Reactome network"].get(
-                        "test", "hypergeometric"),
-                    configuration["Reactome network"].get("increase", True))],
-                multiple_testing_correction=correction.CORRECTION[
-                    configuration["Reactome network"].get(
-                        "correction", "Benjamini-Yekutieli")],
-                organism=configuration["Reactome network"].get(
-                    "organism", 9606),
-                file_pathways=configuration.get("Reactome",
-                                                {}).get("file",
-                                                        {}).get("pathways"),
-                file_pathways_relation=configuration.get("Reactome", {}).get(
-                    "file", {}).get("pathways relation"),
-                file_accession_map=configuration.get("Reactome", {}).get(
-                    "file", {}).get("accession map"),
-                file_uniprot=configuration.get("UniProt", {}).get("file"))
+            proteins = frozenset(network.nodes())
+            reference = None
+
+        # Compile a Reactome network from the selected proteins.
+        pathway_network = reactome_network.get_network(
+            proteins,
+            reference=reference,
+            enrichment_test=test.ENRICHMENT_TEST[(pathway_configuration.get(
+                "test",
+                "hypergeometric"), pathway_configuration.get("increase",
+                                                             True))],
+            multiple_testing_correction=correction.CORRECTION[
+                pathway_configuration.get("correction", "Benjamini-Yekutieli")],
+            organism=pathway_configuration.get("organism", 9606),
+            file_pathways=configuration.get("Reactome",
+                                            {}).get("file", {}).get("pathways"),
+            file_pathways_relation=configuration.get("Reactome", {}).get(
+                "file", {}).get("pathways relation"),
+            file_accession_map=configuration.get("Reactome", {}).get(
+                "file", {}).get("accession map"),
+            file_uniprot=file_uniprot)
 
         # Export the Reactome network.
         file = reactome_network.export(pathway_network,
@@ -1302,6 +938,8 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
 
     # Analyze communities of the protein-protein interaction network.
     if "community detection" in configuration:
+        community_detection = configuration["community detection"]
+
         logger.info("Detecting communities.")
 
         # Derive edge weights for community detection from protein-protein
@@ -1309,26 +947,31 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
         # network.
         protein_interaction_network.set_edge_weights(
             network,
-            weight=average.CONFIDENCE_SCORE_AVERAGE[
-                configuration["community detection"].get("edge weight")])
+            weight=average.CONFIDENCE_SCORE_AVERAGE[community_detection.get(
+                "edge weight")])
 
         # Identify communities of the protein-protein interaction network.
         communities = protein_interaction_network.get_communities(
             network,
-            community_size=configuration["community detection"].get(
-                "community size", network.number_of_nodes()),
+            community_size=community_detection.get("community size",
+                                                   network.number_of_nodes()),
             community_size_average=average.MODULE_SIZE_AVERAGE[
-                configuration["community detection"].get(
-                    "community size average", "mean")],
-            algorithm=modularization.ALGORITHM[
-                configuration["community detection"].get(
-                    "algorithm", "Louvain")],
-            resolution=configuration["community detection"].get(
-                "resolution", 1.0))
+                community_detection.get("community size average", "mean")],
+            algorithm=modularization.ALGORITHM[community_detection.get(
+                "algorithm", "Louvain")],
+            resolution=community_detection.get("resolution", 1.0))
 
         protein_interaction_network.remove_edge_weights(network)
 
-        export = {community: False for community in communities}
+        # Order communities by decreasing size to enumerate them consistently
+        # across exported results, retaining the order of detection for
+        # analyses.
+        ranked_communities = tuple(
+            sorted(communities,
+                   key=lambda community: community.number_of_nodes(),
+                   reverse=True))
+
+        export: set[nx.Graph] = set()
 
     # Assess Gene Ontology term enrichment by the protein-protein interaction
     # network or its densely interacting communities.
@@ -1336,6 +979,10 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
          "Gene Ontology enrichment" in configuration.get(
              "community detection", {})) and
             not os.path.isfile(f"{identifier}_gene_ontology.tsv")):
+        ontology_enrichment = configuration.get("Gene Ontology enrichment", {})
+        local_ontology_enrichment = configuration.get(
+            "community detection", {}).get("Gene Ontology enrichment", {})
+
         logger.info("Gene Ontology enrichment test results are exported to %s.",
                     f"{identifier}_gene_ontology.tsv")
 
@@ -1350,334 +997,40 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 "number of associated proteins", "associated proteins"
             ])
 
-            # Assess Gene Ontology term enrichment by subsets of proteins from
-            # the protein-protein interaction network derived from average
-            # measurements of the proteins for different types of
-            # post-translational modification at different times of measurement.
-            if "post-translational modifications" in configuration.get(
-                    "Gene Ontology enrichment", {}):
-                if configuration["Gene Ontology enrichment"].get(
-                        "intersection", False):
-                    proteins = set(network.nodes())
-                else:
-                    proteins = set()
-
-                for time in protein_interaction_network.get_times(network):
-                    for m in configuration["Gene Ontology enrichment"].get(
-                            "post-translational modifications", []):
-                        if m in protein_interaction_network.get_modifications(
-                                network, time):
-                            measurement_range = (
-                                score.MEASUREMENT_SCORE[configuration[
-                                    "Gene Ontology enrichment"].get(
-                                        "score", {}).get(m)]
-                                (configuration["Gene Ontology enrichment"].get(
-                                    "measurement", {}).get(
-                                        m,
-                                        default.MEASUREMENT_RANGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "score", {}).get(m)])[0],
-                                 protein_interaction_network.get_measurements(
-                                     network, time, m,
-                                     average.SITE_AVERAGE[configuration[
-                                         "Gene Ontology enrichment"].get(
-                                             "site average", {}).get(
-                                                 m,
-                                                 "maximum absolute logarithm")],
-                                     average.REPLICATE_AVERAGE[configuration[
-                                         "Gene Ontology enrichment"].get(
-                                             "replicate average",
-                                             {}).get(m, "mean")])),
-                                score.MEASUREMENT_SCORE[configuration[
-                                    "Gene Ontology enrichment"].get(
-                                        "score", {}).get(m)]
-                                (configuration["Gene Ontology enrichment"].get(
-                                    "measurement", {}).get(
-                                        m,
-                                        default.MEASUREMENT_RANGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "score", {}).get(m)])[1],
-                                 protein_interaction_network.get_measurements(
-                                     network, time, m,
-                                     average.SITE_AVERAGE[configuration[
-                                         "Gene Ontology enrichment"].get(
-                                             "site average", {}).get(
-                                                 m,
-                                                 "maximum absolute logarithm")],
-                                     average.REPLICATE_AVERAGE[configuration[
-                                         "Gene Ontology enrichment"].get(
-                                             "replicate average",
-                                             {}).get(m, "mean")])))
-
-                            if configuration["Gene Ontology enrichment"].get(
-                                    "intersection", False):
-                                proteins.intersection_update(
-                                    protein_interaction_network.get_proteins(
-                                        network, time, m,
-                                        average.SITE_AVERAGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )],
-                                        average.REPLICATE_AVERAGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "replicate average",
-                                                {}).get(m, "mean")],
-                                        measurement_range))
-
-                            else:
-                                proteins.update(
-                                    protein_interaction_network.get_proteins(
-                                        network, time, m,
-                                        average.SITE_AVERAGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )],
-                                        average.REPLICATE_AVERAGE[configuration[
-                                            "Gene Ontology enrichment"].get(
-                                                "replicate average",
-                                                {}).get(m, "mean")],
-                                        measurement_range))
-
-                gene_ontology_enrichment = gene_ontology.get_enrichment(
-                    [frozenset(proteins)],
-                    reference=[set()]
-                    if configuration["Gene Ontology enrichment"].get(
-                        "annotation", False) else [network.nodes()],
-                    enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["Gene Ontology enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["Gene Ontology enrichment"].get(
-                            "increase", True))],
-                    multiple_testing_correction=correction.CORRECTION[
-                        configuration["Gene Ontology enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["Gene Ontology enrichment"].get(
-                        "organism", 9606),
-                    namespaces=[
-                        namespace.replace(" ", "_") for namespace in
-                        configuration["Gene Ontology enrichment"].get(
-                            "namespaces", [])
-                    ],
-                    file_ontology=configuration.get("Gene Ontology",
-                                                    {}).get("file",
-                                                            {}).get("ontology"),
-                    file_annotation=configuration.get("Gene Ontology", {}).get(
-                        "file", {}).get("annotation"),
-                    file_annotation_isoform=configuration.get(
-                        "Gene Ontology", {}).get("file",
-                                                 {}).get("annotation isoform"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for (term, name), (p, prt) in sorted(
-                        gene_ontology_enrichment[frozenset(proteins)].items(),
-                        key=lambda item: item[0][0]):
-                    if p <= configuration["Gene Ontology enrichment"].get(
-                            "p", 1.0):
-                        gene_ontology_writer.writerow([
-                            "network", term, name, p,
-                            network.number_of_nodes(),
-                            len(prt), " ".join(sorted(prt))
-                        ])
-
             # Assess Gene Ontology term enrichment by the protein-protein
             # interaction network.
-            elif "Gene Ontology enrichment" in configuration:
-                gene_ontology_enrichment = gene_ontology.get_enrichment(
-                    [frozenset(network.nodes())],
-                    reference=[set()],
-                    enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["Gene Ontology enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["Gene Ontology enrichment"].get(
-                            "increase", True))],
-                    multiple_testing_correction=correction.CORRECTION[
-                        configuration["Gene Ontology enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["Gene Ontology enrichment"].get(
-                        "organism", 9606),
-                    namespaces=[
-                        namespace.replace(" ", "_") for namespace in
-                        configuration["Gene Ontology enrichment"].get(
-                            "namespaces", [])
-                    ],
-                    file_ontology=configuration.get("Gene Ontology",
-                                                    {}).get("file",
-                                                            {}).get("ontology"),
-                    file_annotation=configuration.get("Gene Ontology", {}).get(
-                        "file", {}).get("annotation"),
-                    file_annotation_isoform=configuration.get(
-                        "Gene Ontology", {}).get("file",
-                                                 {}).get("annotation isoform"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for (term,
-                     name), (p,
-                             prt) in sorted(gene_ontology_enrichment[frozenset(
-                                 network.nodes())].items(),
-                                            key=lambda item: item[0][0]):
-                    if p <= configuration["Gene Ontology enrichment"].get(
-                            "p", 1.0):
-                        gene_ontology_writer.writerow([
-                            "network", term, name, p,
-                            network.number_of_nodes(),
-                            len(prt), " ".join(sorted(prt))
-                        ])
-
-            # Assess local Gene Ontology term enrichment by subsets of proteins
-            # from communities of the protein-protein interaction network
-            # derived from average measurements of the proteins for different
-            # types of post-translational modification at different times of
-            # measurement.
-            if "post-translational modifications" in configuration.get(
-                    "community detection", {}).get("Gene Ontology enrichment",
-                                                   {}):
-                if configuration["community detection"][
-                        "Gene Ontology enrichment"].get("intersection", False):
-                    subsets = {
-                        community: set(community.nodes())
-                        for community in communities
-                    }
+            if "Gene Ontology enrichment" in configuration:
+                # Select subsets of proteins from the protein-protein
+                # interaction network derived from average measurements of the
+                # proteins for different types of post-translational
+                # modification at different times of measurement.
+                if "post-translational modifications" in ontology_enrichment:
+                    proteins = select_proteins(network, [network],
+                                               get_measurements, modifications,
+                                               ontology_enrichment)[network]
+                    references = [set()] if ontology_enrichment.get(
+                        "annotation", False) else [network.nodes()]
+
+                # Select the proteins from the protein-protein interaction
+                # network.
                 else:
-                    subsets = {community: set() for community in communities}
-
-                for time in protein_interaction_network.get_times(network):
-                    for m in configuration["community detection"][
-                            "Gene Ontology enrichment"].get(
-                                "post-translational modifications", []):
-                        if m in protein_interaction_network.get_modifications(
-                                network, time):
-                            for community in subsets:
-                                measurement_range = (
-                                    score.MEASUREMENT_SCORE[
-                                        configuration["community detection"]
-                                        ["Gene Ontology enrichment"].get(
-                                            "score", {}).get(m)]
-                                    (configuration["community detection"]
-                                     ["Gene Ontology enrichment"].get(
-                                         "measurement", {}).get(
-                                             m, default.MEASUREMENT_RANGE[
-                                                 configuration[
-                                                     "community detection"]
-                                                 ["Gene Ontology enrichment"].
-                                                 get("score", {}).get(m)])[0],
-                                     protein_interaction_network.
-                                     get_measurements(
-                                         network, time, m, average.SITE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Gene Ontology enrichment"].get(
-                                                 "site average", {}).
-                                             get(m,
-                                                 "maximum absolute logarithm")],
-                                         average.REPLICATE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Gene Ontology enrichment"].get(
-                                                 "replicate average",
-                                                 {}).get(m, "mean")])),
-                                    score.MEASUREMENT_SCORE[
-                                        configuration["community detection"]
-                                        ["Gene Ontology enrichment"].get(
-                                            "score", {}).get(m)]
-                                    (configuration["community detection"]
-                                     ["Gene Ontology enrichment"].get(
-                                         "measurement", {}).get(
-                                             m, default.MEASUREMENT_RANGE[
-                                                 configuration[
-                                                     "community detection"]
-                                                 ["Gene Ontology enrichment"].
-                                                 get("score", {}).get(m)])[1],
-                                     protein_interaction_network.
-                                     get_measurements(
-                                         network, time, m, average.SITE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Gene Ontology enrichment"].get(
-                                                 "site average", {}).
-                                             get(m,
-                                                 "maximum absolute logarithm")],
-                                         average.REPLICATE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Gene Ontology enrichment"].get(
-                                                 "replicate average",
-                                                 {}).get(m, "mean")])))
-
-                                if configuration["community detection"][
-                                        "Gene Ontology enrichment"].get(
-                                            "intersection", False):
-                                    subsets[community].intersection_update(
-                                        protein_interaction_network.
-                                        get_proteins(
-                                            community, time, m,
-                                            average.SITE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Gene Ontology enrichment"].
-                                                get("site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )],
-                                            average.REPLICATE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Gene Ontology enrichment"].
-                                                get("replicate average",
-                                                    {}).get(m, "mean")],
-                                            measurement_range))
-
-                                else:
-                                    subsets[community].update(
-                                        protein_interaction_network.
-                                        get_proteins(
-                                            community, time, m,
-                                            average.SITE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Gene Ontology enrichment"].
-                                                get("site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )],
-                                            average.REPLICATE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Gene Ontology enrichment"].
-                                                get("replicate average",
-                                                    {}).get(m, "mean")],
-                                            measurement_range))
+                    proteins = frozenset(network.nodes())
+                    references = [set()]
 
                 gene_ontology_enrichment = gene_ontology.get_enrichment(
-                    [
-                        frozenset(subsets[community])
-                        for community in communities
-                    ],
-                    reference=[network.nodes()]
-                    if configuration["community detection"]
-                    ["Gene Ontology enrichment"].get("network", False) else
-                    ([set()] if configuration["community detection"]
-                     ["Gene Ontology enrichment"].get("annotation", False) else
-                     [community.nodes() for community in communities]),
+                    [proteins],
+                    reference=references,
                     enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get("increase", True))],
+                        ontology_enrichment.get("test", "hypergeometric"),
+                        ontology_enrichment.get("increase", True))],
                     multiple_testing_correction=correction.CORRECTION[
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["community detection"]
-                    ["Gene Ontology enrichment"].get("organism", 9606),
+                        ontology_enrichment.get("correction",
+                                                "Benjamini-Yekutieli")],
+                    organism=ontology_enrichment.get("organism", 9606),
                     namespaces=[
                         namespace.replace(" ", "_")
-                        for namespace in configuration["community detection"]
-                        ["Gene Ontology enrichment"].get("namespaces", [])
+                        for namespace in ontology_enrichment.get(
+                            "namespaces", [])
                     ],
                     file_ontology=configuration.get("Gene Ontology",
                                                     {}).get("file",
@@ -1687,51 +1040,38 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                     file_annotation_isoform=configuration.get(
                         "Gene Ontology", {}).get("file",
                                                  {}).get("annotation isoform"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for k, community in enumerate(sorted(
-                        communities,
-                        key=lambda community: int(community.number_of_nodes()),
-                        reverse=True),
-                                              start=1):
-                    for (term, name), (p, prt) in sorted(
-                            gene_ontology_enrichment[frozenset(
-                                subsets[community])].items(),
-                            key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "Gene Ontology enrichment"].get("p", 1.0):
-                            export[community] = True
-                            gene_ontology_writer.writerow([
-                                f"community {k}", term, name, p,
-                                community.number_of_nodes(),
-                                len(prt), " ".join(sorted(prt))
-                            ])
+                    file_uniprot=file_uniprot)
+
+                gene_ontology_writer.writerows(
+                    get_enrichment_rows("network", network,
+                                        gene_ontology_enrichment[proteins],
+                                        ontology_enrichment.get("p", 1.0)))
 
             # Assess local Gene Ontology term enrichment by communities of the
             # protein-protein interaction network.
-            elif "Gene Ontology enrichment" in configuration.get(
+            if "Gene Ontology enrichment" in configuration.get(
                     "community detection", {}):
+                # Select subsets of proteins from communities of the
+                # protein-protein interaction network and reference sets of
+                # proteins.
+                subsets, references = select_local_proteins(
+                    network, communities, get_measurements, modifications,
+                    local_ontology_enrichment)
+
                 gene_ontology_enrichment = gene_ontology.get_enrichment(
-                    [frozenset(community.nodes()) for community in communities],
-                    reference=[set()] if configuration["community detection"]
-                    ["Gene Ontology enrichment"].get(
-                        "annotation", False) else [network.nodes()],
+                    [subsets[community] for community in communities],
+                    reference=references,
                     enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get("increase", True))],
+                        local_ontology_enrichment.get("test", "hypergeometric"),
+                        local_ontology_enrichment.get("increase", True))],
                     multiple_testing_correction=correction.CORRECTION[
-                        configuration["community detection"]
-                        ["Gene Ontology enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["community detection"]
-                    ["Gene Ontology enrichment"].get("organism", 9606),
+                        local_ontology_enrichment.get("correction",
+                                                      "Benjamini-Yekutieli")],
+                    organism=local_ontology_enrichment.get("organism", 9606),
                     namespaces=[
                         namespace.replace(" ", "_")
-                        for namespace in configuration["community detection"]
-                        ["Gene Ontology enrichment"].get("namespaces", [])
+                        for namespace in local_ontology_enrichment.get(
+                            "namespaces", [])
                     ],
                     file_ontology=configuration.get("Gene Ontology",
                                                     {}).get("file",
@@ -1741,25 +1081,16 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                     file_annotation_isoform=configuration.get(
                         "Gene Ontology", {}).get("file",
                                                  {}).get("annotation isoform"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for k, community in enumerate(sorted(
-                        communities,
-                        key=lambda community: int(community.number_of_nodes()),
-                        reverse=True),
-                                              start=1):
-                    for (term, name), (p, prt) in sorted(
-                            gene_ontology_enrichment[frozenset(
-                                community.nodes())].items(),
-                            key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "Gene Ontology enrichment"].get("p", 1.0):
-                            export[community] = True
-                            gene_ontology_writer.writerow([
-                                f"community {k}", term, name, p,
-                                community.number_of_nodes(),
-                                len(prt), " ".join(sorted(prt))
-                            ])
+                    file_uniprot=file_uniprot)
+
+                for k, community in enumerate(ranked_communities, start=1):
+                    rows = get_enrichment_rows(
+                        f"community {k}", community,
+                        gene_ontology_enrichment[subsets[community]],
+                        local_ontology_enrichment.get("p", 1.0))
+                    if rows:
+                        export.add(community)
+                        gene_ontology_writer.writerows(rows)
     else:
         logger.warning(
             "Gene Ontology enrichment test results are not exported due to "
@@ -1770,6 +1101,10 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
     if (("Reactome enrichment" in configuration or "Reactome enrichment"
          in configuration.get("community detection", {})) and
             not os.path.isfile(f"{identifier}_reactome.tsv")):
+        pathway_enrichment = configuration.get("Reactome enrichment", {})
+        local_pathway_enrichment = configuration.get(
+            "community detection", {}).get("Reactome enrichment", {})
+
         logger.info("Reactome enrichment test results are exported to %s.",
                     f"{identifier}_reactome.tsv")
 
@@ -1783,373 +1118,84 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 "number of associated proteins", "associated proteins"
             ])
 
-            # Assess Reactome pathway enrichment by subsets of proteins from the
-            # protein-protein interaction network derived from average
-            # measurements of the proteins for different types of
-            # post-translational modification at different times of measurement.
-            if "post-translational modifications" in configuration.get(
-                    "Reactome enrichment", {}):
-                if configuration["Reactome enrichment"].get(
-                        "intersection", False):
-                    proteins = set(network.nodes())
-                else:
-                    proteins = set()
-
-                for time in protein_interaction_network.get_times(network):
-                    for m in configuration["Reactome enrichment"].get(
-                            "post-translational modifications", []):
-                        if m in protein_interaction_network.get_modifications(
-                                network, time):
-                            measurement_range = (
-                                score.MEASUREMENT_SCORE[
-                                    configuration["Reactome enrichment"].get(
-                                        "score", {}).get(m)]
-                                (configuration["Reactome enrichment"].get(
-                                    "measurement", {}).get(
-                                        m,
-                                        default.MEASUREMENT_RANGE[configuration[
-                                            "Reactome enrichment"].get(
-                                                "score", {}).get(m)])[0],
-                                 protein_interaction_network.get_measurements(
-                                     network, time, m,
-                                     average.SITE_AVERAGE[configuration[
-                                         "Reactome enrichment"].get(
-                                             "site average", {}).get(
-                                                 m,
-                                                 "maximum absolute logarithm")],
-                                     average.REPLICATE_AVERAGE[configuration[
-                                         "Reactome enrichment"].get(
-                                             "replicate average",
-                                             {}).get(m, "mean")])),
-                                score.MEASUREMENT_SCORE[
-                                    configuration["Reactome enrichment"].get(
-                                        "score", {}).get(m)]
-                                (configuration["Reactome enrichment"].get(
-                                    "measurement", {}).get(
-                                        m,
-                                        default.MEASUREMENT_RANGE[configuration[
-                                            "Reactome enrichment"].get(
-                                                "score", {}).get(m)])[1],
-                                 protein_interaction_network.get_measurements(
-                                     network, time, m,
-                                     average.SITE_AVERAGE[configuration[
-                                         "Reactome enrichment"].get(
-                                             "site average", {}).get(
-                                                 m,
-                                                 "maximum absolute logarithm")],
-                                     average.REPLICATE_AVERAGE[configuration[
-                                         "Reactome enrichment"].get(
-                                             "replicate average",
-                                             {}).get(m, "mean")])))
-
-                            if configuration["Reactome enrichment"].get(
-                                    "intersection", False):
-                                proteins.intersection_update(
-                                    protein_interaction_network.get_proteins(
-                                        network, time, m, average.SITE_AVERAGE[
-                                            configuration["Reactome enrichment"]
-                                            .get("site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                        average.REPLICATE_AVERAGE[configuration[
-                                            "Reactome enrichment"].get(
-                                                "replicate average",
-                                                {}).get(m, "mean")],
-                                        measurement_range))
-
-                            else:
-                                proteins.update(
-                                    protein_interaction_network.get_proteins(
-                                        network, time, m, average.SITE_AVERAGE[
-                                            configuration["Reactome enrichment"]
-                                            .get("site average", {}).get(
-                                                m,
-                                                "maximum absolute logarithm")],
-                                        average.REPLICATE_AVERAGE[configuration[
-                                            "Reactome enrichment"].get(
-                                                "replicate average",
-                                                {}).get(m, "mean")],
-                                        measurement_range))
-
-                reactome_enrichment = reactome.get_enrichment(
-                    [frozenset(proteins)],
-                    reference=[set()]
-                    if configuration["Reactome enrichment"].get(
-                        "annotation", False) else [network.nodes()],
-                    enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["Reactome enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["Reactome enrichment"].get(
-                            "increase", True))],
-                    multiple_testing_correction=correction.CORRECTION[
-                        configuration["Reactome enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["Reactome enrichment"].get(
-                        "organism", 9606),
-                    file_pathways=configuration.get("Reactome",
-                                                    {}).get("file",
-                                                            {}).get("pathways"),
-                    file_accession_map=configuration.get("Reactome", {}).get(
-                        "file", {}).get("accession map"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for (pathway, name), (p, prt) in sorted(
-                        reactome_enrichment[frozenset(proteins)].items(),
-                        key=lambda item: item[0][0]):
-                    if p <= configuration["Reactome enrichment"].get("p", 1.0):
-                        reactome_writer.writerow([
-                            "network", pathway, name, p,
-                            network.number_of_nodes(),
-                            len(prt), " ".join(sorted(prt))
-                        ])
-
             # Assess Reactome pathway enrichment by the protein-protein
             # interaction network.
-            elif "Reactome enrichment" in configuration:
-                reactome_enrichment = reactome.get_enrichment(
-                    [frozenset(network.nodes())],
-                    reference=[set()],
-                    enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["Reactome enrichment"].get(
-                            "test", "hypergeometric"),
-                        configuration["Reactome enrichment"].get(
-                            "increase", True))],
-                    multiple_testing_correction=correction.CORRECTION[
-                        configuration["Reactome enrichment"].get(
-                            "correction", "Benjamini-Yekutieli")],
-                    organism=configuration["Reactome enrichment"].get(
-                        "organism", 9606),
-                    file_pathways=configuration.get("Reactome",
-                                                    {}).get("file",
-                                                            {}).get("pathways"),
-                    file_accession_map=configuration.get("Reactome", {}).get(
-                        "file", {}).get("accession map"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for (pathway, name), (p, prt) in sorted(
-                        reactome_enrichment[frozenset(network.nodes())].items(),
-                        key=lambda item: item[0][0]):
-                    if p <= configuration["Reactome enrichment"].get("p", 1.0):
-                        reactome_writer.writerow([
-                            "network", pathway, name, p,
-                            network.number_of_nodes(),
-                            len(prt), " ".join(sorted(prt))
-                        ])
-
-            # Assess local Reactome pathway enrichment by subsets of proteins
-            # from communities of the protein-protein interaction network
-            # derived from average measurements of the proteins for different
-            # types of post-translational modification at different times of
-            # measurement.
-            if "post-translational modifications" in configuration.get(
-                    "community detection", {}).get("Reactome enrichment", {}):
-                if configuration["community detection"][
-                        "Reactome enrichment"].get("intersection", False):
-                    subsets = {
-                        community: set(community.nodes())
-                        for community in communities
-                    }
+            if "Reactome enrichment" in configuration:
+                # Select subsets of proteins from the protein-protein
+                # interaction network derived from average measurements of the
+                # proteins for different types of post-translational
+                # modification at different times of measurement.
+                if "post-translational modifications" in pathway_enrichment:
+                    proteins = select_proteins(network, [network],
+                                               get_measurements, modifications,
+                                               pathway_enrichment)[network]
+                    references = [set()] if pathway_enrichment.get(
+                        "annotation", False) else [network.nodes()]
+
+                # Select the proteins from the protein-protein interaction
+                # network.
                 else:
-                    subsets = {community: set() for community in communities}
-
-                for time in protein_interaction_network.get_times(network):
-                    for m in configuration["community detection"][
-                            "Reactome enrichment"].get(
-                                "post-translational modifications", []):
-                        if m in protein_interaction_network.get_modifications(
-                                network, time):
-                            for community in subsets:
-                                measurement_range = (
-                                    score.MEASUREMENT_SCORE[
-                                        configuration["community detection"]
-                                        ["Reactome enrichment"].get(
-                                            "score", {}).get(m)]
-                                    (configuration["community detection"]
-                                     ["Reactome enrichment"].get(
-                                         "measurement", {}).get(
-                                             m, default.MEASUREMENT_RANGE[
-                                                 configuration[
-                                                     "community detection"]
-                                                 ["Reactome enrichment"].get(
-                                                     "score", {}).get(m)])[0],
-                                     protein_interaction_network.
-                                     get_measurements(
-                                         network, time, m, average.SITE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Reactome enrichment"].get(
-                                                 "site average", {}).
-                                             get(m,
-                                                 "maximum absolute logarithm")],
-                                         average.REPLICATE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Reactome enrichment"].get(
-                                                 "replicate average",
-                                                 {}).get(m, "mean")])),
-                                    score.MEASUREMENT_SCORE[
-                                        configuration["community detection"]
-                                        ["Reactome enrichment"].get(
-                                            "score", {}).get(m)]
-                                    (configuration["community detection"]
-                                     ["Reactome enrichment"].get(
-                                         "measurement", {}).get(
-                                             m, default.MEASUREMENT_RANGE[
-                                                 configuration[
-                                                     "community detection"]
-                                                 ["Reactome enrichment"].get(
-                                                     "score", {}).get(m)])[1],
-                                     protein_interaction_network.
-                                     get_measurements(
-                                         network, time, m, average.SITE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Reactome enrichment"].get(
-                                                 "site average", {}).
-                                             get(m,
-                                                 "maximum absolute logarithm")],
-                                         average.REPLICATE_AVERAGE[
-                                             configuration[
-                                                 "community detection"]
-                                             ["Reactome enrichment"].get(
-                                                 "replicate average",
-                                                 {}).get(m, "mean")])))
-
-                                if configuration["community detection"][
-                                        "Reactome enrichment"].get(
-                                            "intersection", False):
-                                    subsets[community].intersection_update(
-                                        protein_interaction_network.
-                                        get_proteins(
-                                            community, time, m,
-                                            average.SITE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Reactome enrichment"].
-                                                get("site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )], average.REPLICATE_AVERAGE[
-                                                    configuration[
-                                                        "community detection"]
-                                                    ["Reactome enrichment"].get(
-                                                        "replicate average",
-                                                        {}).get(m, "mean")],
-                                            measurement_range))
-
-                                else:
-                                    subsets[community].update(
-                                        protein_interaction_network.
-                                        get_proteins(
-                                            community, time, m,
-                                            average.SITE_AVERAGE[
-                                                configuration[
-                                                    "community detection"]
-                                                ["Reactome enrichment"].
-                                                get("site average", {}).get(
-                                                    m,
-                                                    "maximum absolute logarithm"
-                                                )], average.REPLICATE_AVERAGE[
-                                                    configuration[
-                                                        "community detection"]
-                                                    ["Reactome enrichment"].get(
-                                                        "replicate average",
-                                                        {}).get(m, "mean")],
-                                            measurement_range))
+                    proteins = frozenset(network.nodes())
+                    references = [set()]
 
                 reactome_enrichment = reactome.get_enrichment(
-                    [
-                        frozenset(subsets[community])
-                        for community in communities
-                    ],
-                    reference=[network.nodes()]
-                    if configuration["community detection"]
-                    ["Reactome enrichment"].get("network", False) else
-                    ([set()] if configuration["community detection"]
-                     ["Reactome enrichment"].get("annotation", False) else
-                     [community.nodes() for community in communities]),
+                    [proteins],
+                    reference=references,
                     enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("test", "hypergeometric"),
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("increase", True))],
+                        pathway_enrichment.get("test", "hypergeometric"),
+                        pathway_enrichment.get("increase", True))],
                     multiple_testing_correction=correction.CORRECTION[
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("correction",
-                                                    "Benjamini-Yekutieli")],
-                    organism=configuration["community detection"]
-                    ["Reactome enrichment"].get("organism", 9606),
+                        pathway_enrichment.get("correction",
+                                               "Benjamini-Yekutieli")],
+                    organism=pathway_enrichment.get("organism", 9606),
                     file_pathways=configuration.get("Reactome",
                                                     {}).get("file",
                                                             {}).get("pathways"),
                     file_accession_map=configuration.get("Reactome", {}).get(
                         "file", {}).get("accession map"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for k, community in enumerate(sorted(
-                        communities,
-                        key=lambda community: int(community.number_of_nodes()),
-                        reverse=True),
-                                              start=1):
-                    for (pathway,
-                         name), (p,
-                                 prt) in sorted(reactome_enrichment[frozenset(
-                                     subsets[community])].items(),
-                                                key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "Reactome enrichment"].get("p", 1.0):
-                            export[community] = True
-                            reactome_writer.writerow([
-                                f"community {k}", pathway, name, p,
-                                community.number_of_nodes(),
-                                len(prt), " ".join(sorted(prt))
-                            ])
+                    file_uniprot=file_uniprot)
+
+                reactome_writer.writerows(
+                    get_enrichment_rows("network", network,
+                                        reactome_enrichment[proteins],
+                                        pathway_enrichment.get("p", 1.0)))
 
             # Assess local Reactome pathway enrichment by communities of the
             # protein-protein interaction network.
-            elif "Reactome enrichment" in configuration:
+            if "Reactome enrichment" in configuration.get(
+                    "community detection", {}):
+                # Select subsets of proteins from communities of the
+                # protein-protein interaction network and reference sets of
+                # proteins.
+                subsets, references = select_local_proteins(
+                    network, communities, get_measurements, modifications,
+                    local_pathway_enrichment)
+
                 reactome_enrichment = reactome.get_enrichment(
-                    [frozenset(community.nodes()) for community in communities],
-                    reference=[set()] if configuration["community detection"]
-                    ["Reactome enrichment"].get("annotation",
-                                                False) else [network.nodes()],
+                    [subsets[community] for community in communities],
+                    reference=references,
                     enrichment_test=test.ENRICHMENT_TEST[(
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("test", "hypergeometric"),
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("increase", True))],
+                        local_pathway_enrichment.get("test", "hypergeometric"),
+                        local_pathway_enrichment.get("increase", True))],
                     multiple_testing_correction=correction.CORRECTION[
-                        configuration["community detection"]
-                        ["Reactome enrichment"].get("correction",
-                                                    "Benjamini-Yekutieli")],
-                    organism=configuration["community detection"]
-                    ["Reactome enrichment"].get("organism", 9606),
+                        local_pathway_enrichment.get("correction",
+                                                     "Benjamini-Yekutieli")],
+                    organism=local_pathway_enrichment.get("organism", 9606),
                     file_pathways=configuration.get("Reactome",
                                                     {}).get("file",
                                                             {}).get("pathways"),
                     file_accession_map=configuration.get("Reactome", {}).get(
                         "file", {}).get("accession map"),
-                    file_uniprot=configuration.get("UniProt", {}).get("file"))
-
-                for k, community in enumerate(sorted(
-                        communities,
-                        key=lambda community: int(community.number_of_nodes()),
-                        reverse=True),
-                                              start=1):
-                    for (pathway,
-                         name), (p,
-                                 prt) in sorted(reactome_enrichment[frozenset(
-                                     community.nodes())].items(),
-                                                key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "Reactome enrichment"].get("p", 1.0):
-                            export[community] = True
-                            reactome_writer.writerow([
-                                f"community {k}", pathway, name, p,
-                                community.number_of_nodes(),
-                                len(prt), " ".join(sorted(prt))
-                            ])
-
+                    file_uniprot=file_uniprot)
+
+                for k, community in enumerate(ranked_communities, start=1):
+                    rows = get_enrichment_rows(
+                        f"community {k}", community,
+                        reactome_enrichment[subsets[community]],
+                        local_pathway_enrichment.get("p", 1.0))
+                    if rows:
+                        export.add(community)
+                        reactome_writer.writerows(rows)
     else:
         logger.warning(
             "Reactome enrichment test results are not exported due to naming "
@@ -2176,17 +1222,19 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 "number of associated proteins", "associated proteins"
             ])
 
+            measurement_enrichment = configuration["community detection"][
+                "measurement enrichment"]
+
             measurement_ranges = {
                 modification:
                 default.MEASUREMENT_RANGE.get(score,
                                               default.MEASUREMENT_RANGE[None])
-                for modification, score in configuration["community detection"]
-                ["measurement enrichment"].get("score", {}).items()
+                for modification, score in measurement_enrichment.get(
+                    "score", {}).items()
             }
 
-            for modification, measurement_range in configuration[
-                    "community detection"]["measurement enrichment"].get(
-                        "measurement", {}).items():
+            for modification, measurement_range in measurement_enrichment.get(
+                    "measurement", {}).items():
                 measurement_ranges[modification] = measurement_range
 
             enrichment = protein_interaction_network.get_enrichment(
@@ -2198,52 +1246,48 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                     score.MEASUREMENT_SCORE.get(measurement_score,
                                                 score.MEASUREMENT_SCORE[None])
                     for modification, measurement_score in
-                    configuration["community detection"]
-                    ["measurement enrichment"].get("score", {})
+                    measurement_enrichment.get("score", {}).items()
                 },
                 site_average={
                     modification: average.SITE_AVERAGE.get(
                         site_average,
                         average.SITE_AVERAGE["maximum absolute logarithm"])
-                    if site_average is not None else None for modification,
-                    site_average in configuration["community detection"]
-                    ["measurement enrichment"].get("site average", {}).items()
+                    if site_average is not None else None
+                    for modification, site_average in
+                    measurement_enrichment.get("site average", {}).items()
                 },
                 replicate_average={
                     modification: average.REPLICATE_AVERAGE.get(
                         replicate_average, average.REPLICATE_AVERAGE["mean"])
-                    if replicate_average is not None else None for modification,
-                    replicate_average in configuration["community detection"]
-                    ["measurement enrichment"].get("replicate average",
-                                                   {}).items()
+                    if replicate_average is not None else None
+                    for modification, replicate_average in
+                    measurement_enrichment.get("replicate average", {}).items()
                 },
                 enrichment_test=test.ENRICHMENT_TEST[(
-                    configuration["community detection"]
-                    ["measurement enrichment"].get("test", "hypergeometric"),
-                    configuration["community detection"]
-                    ["measurement enrichment"].get("increase", True))],
+                    measurement_enrichment.get("test", "hypergeometric"),
+                    measurement_enrichment.get("increase", True))],
                 multiple_testing_correction=correction.CORRECTION[
-                    configuration["community detection"]
-                    ["measurement enrichment"].get("correction",
-                                                   "Benjamini-Yekutieli")])
-
-            for k, community in enumerate(sorted(
-                    communities,
-                    key=lambda community: int(community.number_of_nodes()),
-                    reverse=True),
-                                          start=1):
-                for time in enrichment[community]:
-                    for modification, (p, prt) in sorted(
-                            enrichment[community][time].items(),
-                            key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "measurement enrichment"].get("p", 1.0):
-                            export[community] = True
-                            measurement_enrichment_writer.writerow([
-                                f"community {k}", time, modification, p,
-                                community.number_of_nodes(),
-                                len(prt), " ".join(sorted(prt))
-                            ])
+                    measurement_enrichment.get("correction",
+                                               "Benjamini-Yekutieli")])
+
+            for k, community in enumerate(ranked_communities, start=1):
+                # Discard insignificant results before ordering them by time
+                # of measurement and type of post-translational modification.
+                significant_enrichment = [
+                    (time, modification, result)
+                    for time, results in enrichment[community].items()
+                    for modification, result in results.items()
+                    if result[0] <= measurement_enrichment.get("p", 1.0)
+                ]
+                significant_enrichment.sort(key=lambda item: (item[0], item[1]))
+                rows = [[
+                    f"community {k}", time, modification, p,
+                    community.number_of_nodes(),
+                    len(prt), " ".join(sorted(prt))
+                ] for time, modification, (p, prt) in significant_enrichment]
+                if rows:
+                    export.add(community)
+                    measurement_enrichment_writer.writerows(rows)
     else:
         logger.warning(
             "Measurement enrichment test results are not exported due to "
@@ -2269,6 +1313,9 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                 "p-value", "number of proteins"
             ])
 
+            measurement_location = configuration["community detection"][
+                "measurement location"]
+
             location = protein_interaction_network.get_location(
                 network,
                 communities,
@@ -2276,47 +1323,43 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
                     modification: average.SITE_AVERAGE.get(
                         site_average,
                         average.SITE_AVERAGE["maximum absolute logarithm"])
-                    if site_average is not None else None for modification,
-                    site_average in configuration["community detection"]
-                    ["measurement location"].get("site average", {}).items()
+                    if site_average is not None else None
+                    for modification, site_average in measurement_location.get(
+                        "site average", {}).items()
                 },
                 replicate_average={
                     modification: average.REPLICATE_AVERAGE.get(
                         replicate_average, average.REPLICATE_AVERAGE["mean"])
                     if replicate_average is not None else None
                     for modification, replicate_average in
-                    configuration["community detection"]["measurement location"]
-                    .get("replicate average", {}).items()
+                    measurement_location.get("replicate average", {}).items()
                 },
                 location_test=test.LOCATION_TEST[(
-                    configuration["community detection"]
-                    ["measurement location"].get("test",
-                                                 "Mann-Whitney-Wilcoxon"),
-                    configuration["community detection"]
-                    ["measurement location"].get("increase", True),
-                    configuration["community detection"]
-                    ["measurement location"].get("absolute", True))],
+                    measurement_location.get("test", "Mann-Whitney-Wilcoxon"),
+                    measurement_location.get("increase", True),
+                    measurement_location.get("absolute", True),
+                )],
                 multiple_testing_correction=correction.CORRECTION[
-                    configuration["community detection"]
-                    ["measurement location"].get("correction",
-                                                 "Benjamini-Yekutieli")])
-
-            for k, community in enumerate(sorted(
-                    communities,
-                    key=lambda community: int(community.number_of_nodes()),
-                    reverse=True),
-                                          start=1):
-                for time in location[community]:
-                    for modification, p in sorted(
-                            location[community][time].items(),
-                            key=lambda item: item[0][0]):
-                        if p <= configuration["community detection"][
-                                "measurement location"].get("p", 1.0):
-                            export[community] = True
-                            measurement_location_writer.writerow([
-                                f"community {k}", time, modification, p,
-                                community.number_of_nodes()
-                            ])
+                    measurement_location.get("correction",
+                                             "Benjamini-Yekutieli")])
+
+            for k, community in enumerate(ranked_communities, start=1):
+                # Discard insignificant results before ordering them by time
+                # of measurement and type of post-translational modification.
+                significant_location = [
+                    (time, modification, p)
+                    for time, results in location[community].items()
+                    for modification, p in results.items()
+                    if p <= measurement_location.get("p", 1.0)
+                ]
+                significant_location.sort(key=lambda item: (item[0], item[1]))
+                rows = [[
+                    f"community {k}", time, modification, p,
+                    community.number_of_nodes()
+                ] for time, modification, p in significant_location]
+                if rows:
+                    export.add(community)
+                    measurement_location_writer.writerows(rows)
 
     else:
         logger.warning(
@@ -2326,17 +1369,13 @@ def process_workflow(identifier: str, configuration: Mapping[str, Any]) -> None:
     # Export the communities of the protein-protein interaction network
     # significant according to any of the specified hypothesis tests.
     files = []
-    for k, community in enumerate(sorted(
-            communities,
-            key=lambda community: int(community.number_of_nodes()),
-            reverse=True),
-                                  start=1):
-        if export[community]:
+    for k, community in enumerate(ranked_communities, start=1):
+        if community in export:
             files.append(
                 protein_interaction_network.export(community,
                                                    f"{identifier}_{k}"))
 
-    if any(export):
+    if export:
         if any(file is None for file in files):
             logger.warning(
                 "Communities of the protein-protein interaction network were "
@@ -2412,13 +1451,36 @@ def main() -> None:
         level=args.logging,
         encoding="utf-8")
 
-    # Process configuration files concurrently.
-    with concurrent.futures.ProcessPoolExecutor(
-            max_workers=args.processes) as executor:
-        for process in executor.map(process_configuration_file,
-                                    args.configuration):
-            if process:
-                process.results()
+    # Discard repeated and nonexistent configuration files.
+    configuration_files: list[str] = []
+    for configuration_file in dict.fromkeys(args.configuration):
+        if os.path.isfile(configuration_file):
+            configuration_files.append(configuration_file)
+        else:
+            logging.warning("Configuration file %s does not exist.",
+                            configuration_file)
+
+    # Exit with an error if no configuration file remains to be processed.
+    if not configuration_files:
+        parser.error("no configuration file exists")
+
+    # Process a single configuration file without starting additional
+    # processes.
+    if len(configuration_files) == 1:
+        process_configuration_file(configuration_files[0])
+
+    # Process configuration files concurrently, raising errors of any workflow
+    # as soon as its configuration file is processed.
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(args.processes or len(configuration_files),
+                                len(configuration_files))) as executor:
+            for future in concurrent.futures.as_completed([
+                    executor.submit(process_configuration_file,
+                                    configuration_file)
+                    for configuration_file in configuration_files
+            ]):
+                future.result()
 
 
 if __name__ == "__main__":
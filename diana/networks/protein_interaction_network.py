@@ -323,15 +323,21 @@ def map_proteins(network: nx.Graph,
         The proteins not present in the queried portion of Swiss-Prot specific
         to the organism of interest.
     """
+    # Index nodes of the protein-protein interaction network by their UniProt
+    # protein accessions without isoform identifiers.
+    nodes: dict[str, list[str]] = {}
+    for node in network:
+        nodes.setdefault(node.split("-")[0], []).append(node)
+
     # Compile a map from UniProt protein accessions present in the
     # protein-protein interaction network to primary UniProt protein accessions
     # and associated gene and protein names.
     mapping, gene_name, protein_name = {}, {}, {}
     for accessions, gene, protein in uniprot.get_swiss_prot_entries(
             organism, file):
-        for node in network:
-            if node.split("-")[0] in accessions:
-                if "-" in node and accessions.index(node.split("-")[0]) == 0:
+        for accession in set(accessions).intersection(nodes):
+            for node in nodes[accession]:
+                if "-" in node and accession == accessions[0]:
                     mapping[node] = node
                     gene_name[node] = gene
                     protein_name[node] = protein
@@ -1527,6 +1533,12 @@ def get_enrichment(
         are not averaged, proteins with any measurement exceeding the range are
         returned.
     """
+    # Compile a map from times of measurement to types of post-translational
+    # modification represented in the protein-protein interaction network.
+    modifications = {
+        time: get_modifications(network, time) for time in get_times(network)
+    }
+
     # Test the enrichment of average measurements a at most a lower or at least
     # an upper threshold by communities of the protein-protein interaction
     # network for different types of post-translational modification at
@@ -1534,33 +1546,41 @@ def get_enrichment(
     p_values: dict[Hashable, float] = {}
 
     proteins = {}
-    for time in get_times(network):
-        for modification in get_modifications(network, time):
+    for time in modifications:
+        for modification in modifications[time]:
+            # Compile the average measurements of the protein-protein
+            # interaction network and its communities for a type of
+            # post-translational modification at a time of measurement.
+            network_distribution = get_measurements(
+                network, time, modification, site_average.get(modification),
+                replicate_average.get(modification))
+
+            community_distributions = {
+                community: get_measurements(community, time, modification,
+                                            site_average.get(modification),
+                                            replicate_average.get(modification))
+                for community in communities
+            }
+
             # Determine the lower and upper threshold of the average measurement
             # for a type of post-translational modification at a time of
             # measurement.
-            measurement_range = (
-                measurement_score.get(
-                    modification, lambda measurement, _: measurement)(
-                        measurement_ranges.get(modification, (-1.0, 1.0))[0],
-                        get_measurements(network, time, modification,
-                                         site_average.get(modification),
-                                         replicate_average.get(modification))),
-                measurement_score.get(
-                    modification, lambda measurement, _: measurement)(
-                        measurement_ranges.get(modification, (-1.0, 1.0))[1],
-                        get_measurements(network, time, modification,
-                                         site_average.get(modification),
-                                         replicate_average.get(modification))))
+            score_measurement = measurement_score.get(
+                modification, lambda measurement, _: measurement)
+            measurement_bounds = measurement_ranges.get(modification,
+                                                        (-1.0, 1.0))
+            measurement_range = (score_measurement(measurement_bounds[0],
+                                                   network_distribution),
+                                 score_measurement(measurement_bounds[1],
+                                                   network_distribution))
 
             # Determine the number of average measurements in the
             # protein-protein interaction network associated with measurements
             # for a type of post-translational modification at a time of
             # measurement.
             measurements = len([
-                measurement for measurement in get_measurements(
-                    network, time, modification, site_average.get(modification),
-                    replicate_average.get(modification)) if measurement
+                measurement for measurement in network_distribution
+                if measurement
             ])
 
             # Compile a map from communities of the protein-protein interaction
@@ -1569,10 +1589,9 @@ def get_enrichment(
             # modification at a time of measurement.
             community_measurements = {
                 community: len([
-                    measurement for measurement in get_measurements(
-                        community, time, modification,
-                        site_average.get(modification),
-                        replicate_average.get(modification)) if measurement
+                    measurement
+                    for measurement in community_distributions[community]
+                    if measurement
                 ]) for community in communities
             }
 
@@ -1581,9 +1600,7 @@ def get_enrichment(
             # for a type of post-translational modification at a time of
             # measurement at most the lower or at least the upper threshold.
             target_measurements = len([
-                measurement for measurement in get_measurements(
-                    network, time, modification, site_average.get(modification),
-                    replicate_average.get(modification))
+                measurement for measurement in network_distribution
                 if measurement <= measurement_range[0] or
                 measurement >= measurement_range[1]
             ])
@@ -1595,10 +1612,8 @@ def get_enrichment(
             # least the upper threshold.
             target_community_measurements = {
                 community: len([
-                    measurement for measurement in get_measurements(
-                        community, time, modification,
-                        site_average.get(modification),
-                        replicate_average.get(modification))
+                    measurement
+                    for measurement in community_distributions[community]
                     if measurement <= measurement_range[0] or
                     measurement >= measurement_range[1]
                 ]) for community in communities
@@ -1639,8 +1654,8 @@ def get_enrichment(
             time: {
                 modification: (p_values[(community, time, modification)],
                                proteins[(community, time, modification)])
-                for modification in get_modifications(network, time)
-            } for time in get_times(network)
+                for modification in modifications[time]
+            } for time in modifications
         } for community in communities
     }
 
@@ -1681,14 +1696,20 @@ def get_location(
         network for each time of measurement and type of post-translational
         modification.
     """
+    # Compile a map from times of measurement to types of post-translational
+    # modification represented in the protein-protein interaction network.
+    modifications = {
+        time: get_modifications(network, time) for time in get_times(network)
+    }
+
     # Test the equality of location of the average measurements of communities
     # relative to the remaining protein-protein interaction network for
     # different types of post-translational modification at different times of
     # measurement.
     p_values: dict[Hashable, float] = {}
 
-    for time in get_times(network):
-        for modification in get_modifications(network, time):
+    for time in modifications:
+        for modification in modifications[time]:
             # Compile the distributions of average measurements for a type of
             # post-translational modification at a time of measurement in each
             # community of the protein-protein interaction network.
@@ -1733,9 +1754,9 @@ def get_location(
         community: {
             time: {
                 modification: p_values[(community, time, modification)]
-                for modification in get_modifications(network, time)
+                for modification in modifications[time]
                 if (community, time, modification) in p_values
-            } for time in get_times(network)
+            } for time in modifications
         } for community in communities
     }
 
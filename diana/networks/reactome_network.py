@@ -108,8 +108,8 @@ def get_network(proteins: Iterable[str],
     })
 
     # Annotate the nodes of the Reactome network with associated proteins.
-    for node in network:
-        network.nodes[node]["p-value"] = p_value[node]
+    for node, p in zip(network, p_value.values()):
+        network.nodes[node]["p-value"] = p
         network.nodes[node]["number of associated proteins"] = len(
             prt_intersection[node])
         network.nodes[node]["associated proteins"] = " ".join(